@@ -25,6 +25,7 @@ class ParsedStep:
     dependencies: List[int] = None  # Indices of steps this depends on
     conditions: List[str] = None    # Conditions for execution
     priority: int = 0               # Execution priority
+    io_bound: bool = True           # Blocks on I/O; CPU-bound steps gain nothing from threads
 
 
 @dataclass
@@ -553,7 +554,8 @@ class AdvancedCommandParser:
                 category='data_generator',
                 params={'project_name': project_name},
                 dependencies=[0],
-                priority=3
+                priority=3,
+                io_bound=False
             ))
         
         return steps
@@ -31,7 +31,9 @@ class OmniAutomator:
             self._validate_config()
             
             # Initialize core components with error handling
-            self.os_adapter = OSAdapterFactory.create_adapter()
+            self.os_adapter = OSAdapterFactory.create_adapter(
+                enhanced=self.config.get('enhanced_windows_adapter', False)
+            )
             self.command_parser = AdvancedCommandParser()
             self.advanced_parser = AdvancedCommandParser()
             
@@ -83,6 +85,11 @@ class OmniAutomator:
         if 'continue_on_error' in self.config:
             if not isinstance(self.config['continue_on_error'], bool):
                 raise ValueError("continue_on_error must be a boolean")
+        
+        # Validate enhanced_windows_adapter
+        if 'enhanced_windows_adapter' in self.config:
+            if not isinstance(self.config['enhanced_windows_adapter'], bool):
+                raise ValueError("enhanced_windows_adapter must be a boolean")
     
     def _is_dangerous_command(self, command: str) -> bool:
         """Check if command contains potentially dangerous operations"""
@@ -488,7 +495,9 @@ class OmniAutomator:
         self.logger.info("Shutting down OmniAutomator")
         self.is_running = False
         self.plugin_manager.shutdown()
-        self.os_adapter.cleanup()
+        self.workflow_engine.shutdown()
+        # The OS adapter is shared with other engines in this process; it is
+        # cleaned up by OSAdapterFactory.reset_adapter() or at exit
     
     def _get_fallback_error_message(self, command: str, error: str, error_type: str) -> str:
         """Generate helpful fallback error message based on error type"""
@@ -3,17 +3,238 @@ Workflow execution engine for complex multi-step automation
 """
 
 import asyncio
+import sys
+import threading
 import time
 import os
+from os.path import join as _pjoin
+from functools import lru_cache
+from string import Template
 from typing import Dict, Any, List, Optional, Callable
 from dataclasses import dataclass
 from enum import Enum
+from collections import Counter, defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .advanced_parser import ComplexCommand, ParsedStep, CommandComplexity
 from ..utils.logger import get_logger
 
 
+# File extension -> language used for code generation
+_EXT_TO_LANG = {
+    '.py': 'python',
+    '.java': 'java',
+    '.js': 'javascript',
+    '.cpp': 'cpp',
+    '.c': 'c',
+}
+
+
+# Special location names resolved by WorkflowEngine._resolve_paths;
+# 'current' is resolved per call since the working directory can change
+_HOME = os.path.expanduser('~')
+_PATH_MAPPINGS = {
+    'desktop': os.path.join(_HOME, 'Desktop'),
+    'documents': os.path.join(_HOME, 'Documents'),
+    'downloads': os.path.join(_HOME, 'Downloads'),
+    'home': _HOME,
+    'temp': os.path.join(_HOME, 'AppData', 'Local', 'Temp') if os.name == 'nt' else '/tmp'
+}
+# Both separators have the same length, so one slice + set lookup tests either
+_DESKTOP_PREFIXES = frozenset(('desktop/', 'desktop\\'))
+_DESKTOP_PREFIX_LEN = len('desktop/')
+_DESKTOP = _PATH_MAPPINGS['desktop']
+
+
+def _to_class_name(algorithm: str) -> str:
+    """Derive a valid Java class name from an algorithm name"""
+    class_name = algorithm.replace('_', '')
+    if class_name and class_name[0].isdigit():
+        class_name = 'Algorithm' + class_name
+    return class_name or 'Main'
+
+
+def _make_dir(path: str) -> None:
+    """Create a directory under an existing parent with a single mkdir"""
+    # Skips the per-component stat walk of os.makedirs; nested names still fall back to it
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        if not os.path.isdir(path):
+            raise
+    except FileNotFoundError:
+        os.makedirs(path, exist_ok=True)
+
+
+# Fallback code templates used when AI generation is unavailable.
+# Each language has a minimal 'simple' template and a documented 'moderate' one;
+# 'complex' algorithms reuse the 'moderate' template.
+_FALLBACK_SOURCES = {
+    ('python', 'simple'): '''# $algorithm
+
+def $func_name():
+    print("Implementation of $algorithm")
+
+if __name__ == "__main__":
+    $func_name()
+''',
+    ('python', 'moderate'): '''"""
+$algorithm implementation
+Auto-generated fallback code
+"""
+
+def main():
+    print(f"Implementation of $algorithm")
+
+if __name__ == "__main__":
+    main()
+''',
+    ('java', 'simple'): '''public class $class_name {
+    public static void main(String[] args) {
+        System.out.println("$algorithm");
+    }
+}
+''',
+    ('java', 'moderate'): '''/**
+ * $algorithm implementation
+ * Auto-generated fallback code
+ */
+public class $class_name {
+    
+    /**
+     * Main method
+     */
+    public static void main(String[] args) {
+        System.out.println("Implementation of $algorithm");
+    }
+}
+''',
+    ('javascript', 'simple'): '''// $algorithm
+
+function main() {
+    console.log("$algorithm");
+}
+
+main();
+''',
+    ('javascript', 'moderate'): '''/**
+ * $algorithm implementation
+ * Auto-generated fallback code
+ */
+
+function main() {
+    console.log("Implementation of $algorithm");
+}
+
+main();
+''',
+    ('cpp', 'simple'): '''#include <iostream>
+using namespace std;
+
+int main() {
+    cout << "$algorithm" << endl;
+    return 0;
+}
+''',
+    ('cpp', 'moderate'): '''#include <iostream>
+using namespace std;
+
+/**
+ * $algorithm implementation
+ * Auto-generated fallback code
+ */
+
+int main() {
+    cout << "Implementation of $algorithm" << endl;
+    return 0;
+}
+''',
+    ('c', 'simple'): '''#include <stdio.h>
+
+int main() {
+    printf("$algorithm\\n");
+    return 0;
+}
+''',
+    ('c', 'moderate'): '''#include <stdio.h>
+
+/**
+ * $algorithm implementation
+ * Auto-generated fallback code
+ */
+
+int main() {
+    printf("Implementation of $algorithm\\n");
+    return 0;
+}
+''',
+}
+
+_FALLBACK_LANGUAGES = frozenset(language for language, _ in _FALLBACK_SOURCES)
+
+_FALLBACK_TEMPLATES = {key: Template(source) for key, source in _FALLBACK_SOURCES.items()}
+for _language in _FALLBACK_LANGUAGES:
+    _FALLBACK_TEMPLATES[(_language, 'complex')] = _FALLBACK_TEMPLATES[(_language, 'moderate')]
+
+# Pre-built even/odd programs, no formatting needed
+_EVEN_ODD_FALLBACKS = {
+    'python': '''#!/usr/bin/env python3
+def check_even_odd(num):
+    return f"{num} is even" if num % 2 == 0 else f"{num} is odd"
+
+if __name__ == "__main__":
+    try:
+        number = int(input("Enter a number: "))
+        print(check_even_odd(number))
+    except ValueError:
+        print("Please enter a valid integer")
+''',
+    'java': '''import java.util.Scanner;
+public class EvenOdd {
+    public static void main(String[] args) {
+        Scanner sc = new Scanner(System.in);
+        try {
+            System.out.print("Enter a number: ");
+            int num = sc.nextInt();
+            System.out.println(num + (num % 2 == 0 ? " is even" : " is odd"));
+        } catch (Exception e) {
+            System.out.println("Invalid input");
+        } finally {
+            sc.close();
+        }
+    }
+}
+''',
+    'javascript': '''const readline = require('readline');
+const rl = readline.createInterface({input: process.stdin, output: process.stdout});
+rl.question('Enter a number: ', (input) => {
+    const num = parseInt(input);
+    console.log(isNaN(num) ? "Invalid input" : num + (num % 2 === 0 ? " is even" : " is odd"));
+    rl.close();
+});
+''',
+    'cpp': '''#include <iostream>
+using namespace std;
+int main() {
+    int num;
+    cout << "Enter a number: ";
+    cin >> num;
+    cout << num << (num % 2 == 0 ? " is even" : " is odd") << endl;
+    return 0;
+}
+''',
+    'c': '''#include <stdio.h>
+int main() {
+    int num;
+    printf("Enter a number: ");
+    scanf("%d", &num);
+    printf("%d is %s\\n", num, num % 2 == 0 ? "even" : "odd");
+    return 0;
+}
+''',
+}
+
+
 class StepStatus(Enum):
     PENDING = "pending"
     RUNNING = "running"
@@ -22,7 +243,11 @@ class StepStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+# dataclass(slots=True) is only available from Python 3.10
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class StepExecution:
     """Execution state for a workflow step"""
     step: ParsedStep
@@ -32,6 +257,8 @@ class StepExecution:
     result: Any = None
     error: Optional[str] = None
     retry_count: int = 0
+    index: int = 0
+    dep_mask: int = 0  # Bit i set when the step depends on step i
 
 
 class WorkflowEngine:
@@ -51,13 +278,31 @@ class WorkflowEngine:
         
         # Progress callbacks
         self.progress_callbacks: List[Callable] = []
+        
+        # Incremental status bookkeeping, updated by _set_status
+        self._status_lock = threading.Lock()
+        self._status_counts: Counter = Counter()
+        self._completed_mask = 0  # Bit i set once step i has completed
+        self._failed_mask = 0  # Bit i set while step i is failed
+        self._running_steps: Dict[int, StepExecution] = {}  # Keyed by step index
+        
+        # Worker pool reused by every parallel step group
+        self._executor = ThreadPoolExecutor(max_workers=self.max_parallel_steps, thread_name_prefix='wf-step')
     
     def execute_workflow(self, complex_command: ComplexCommand) -> Dict[str, Any]:
         """Execute a complex workflow"""
         self.logger.info(f"Starting workflow execution: {complex_command.original_command}")
         
         self.current_workflow = complex_command
-        self.step_executions = [StepExecution(step) for step in complex_command.steps]
+        step_count = len(complex_command.steps)
+        self.step_executions = [
+            StepExecution(step, index=index, dep_mask=self._dependency_mask(step, step_count))
+            for index, step in enumerate(complex_command.steps)
+        ]
+        self._status_counts = Counter({StepStatus.PENDING: len(self.step_executions)})
+        self._completed_mask = 0
+        self._failed_mask = 0
+        self._running_steps = {}
         self.workflow_context = complex_command.context.copy()
 
         # Log detailed step info for debugging complex workflows
@@ -112,7 +357,7 @@ class WorkflowEngine:
         for step_exec in self.step_executions:
             # Check dependencies
             if not self._check_dependencies(step_exec):
-                step_exec.status = StepStatus.SKIPPED
+                self._set_status(step_exec, StepStatus.SKIPPED)
                 self.logger.warning(f"Skipping step due to failed dependencies: {step_exec.step.action}")
                 continue
             
@@ -145,6 +390,7 @@ class WorkflowEngine:
         
         # Group steps by priority and dependencies
         execution_groups = self._group_steps_for_execution()
+        total_groups = len(execution_groups)
         
         results = []
         total_time = 0
@@ -152,7 +398,7 @@ class WorkflowEngine:
         
         for group_index, group in enumerate(execution_groups):
             group_start = time.time()
-            self.logger.info(f"Executing group {group_index + 1}/{len(execution_groups)} with {len(group)} steps")
+            self.logger.info(f"Executing group {group_index + 1}/{total_groups} with {len(group)} steps")
             
             # Execute group (potentially in parallel)
             group_results = self._execute_step_group(group)
@@ -168,7 +414,7 @@ class WorkflowEngine:
                 break
             
             # Notify progress
-            self._notify_progress(group_index + 1, len(execution_groups), group_results)
+            self._notify_progress(group_index + 1, total_groups, group_results)
         
         total_time = time.time() - start_time
         success_count = sum(1 for r in results if r['success'])
@@ -193,13 +439,13 @@ class WorkflowEngine:
             # Check conditions
             if step_exec.step.conditions:
                 if not self._evaluate_conditions(step_exec.step.conditions):
-                    step_exec.status = StepStatus.SKIPPED
+                    self._set_status(step_exec, StepStatus.SKIPPED)
                     self.logger.info(f"Skipping step due to unmet conditions: {step_exec.step.action}")
                     continue
             
             # Check dependencies
             if not self._check_dependencies(step_exec):
-                step_exec.status = StepStatus.SKIPPED
+                self._set_status(step_exec, StepStatus.SKIPPED)
                 continue
             
             # Execute step
@@ -224,7 +470,7 @@ class WorkflowEngine:
         
         for attempt in range(self.max_retries + 1):
             step_exec.retry_count = attempt
-            step_exec.status = StepStatus.RUNNING
+            self._set_status(step_exec, StepStatus.RUNNING)
             step_exec.start_time = time.time()
             
             try:
@@ -251,7 +497,7 @@ class WorkflowEngine:
 
                                 step_exec.end_time = time.time()
                                 step_exec.result = result
-                                step_exec.status = StepStatus.COMPLETED
+                                self._set_status(step_exec, StepStatus.COMPLETED)
                                 execution_time = step_exec.end_time - step_exec.start_time
                                 return {
                                     'success': True,
@@ -290,7 +536,7 @@ class WorkflowEngine:
 
                             step_exec.end_time = time.time()
                             step_exec.result = result
-                            step_exec.status = StepStatus.COMPLETED
+                            self._set_status(step_exec, StepStatus.COMPLETED)
 
                             execution_time = step_exec.end_time - step_exec.start_time
                             return {
@@ -613,7 +859,7 @@ class WorkflowEngine:
                 
                 step_exec.end_time = time.time()
                 step_exec.result = result
-                step_exec.status = StepStatus.COMPLETED
+                self._set_status(step_exec, StepStatus.COMPLETED)
                 
                 execution_time = step_exec.end_time - step_exec.start_time
                 
@@ -632,7 +878,7 @@ class WorkflowEngine:
                     self.logger.info(f"Retrying in {self.retry_delay} seconds...")
                     time.sleep(self.retry_delay)
                 else:
-                    step_exec.status = StepStatus.FAILED
+                    self._set_status(step_exec, StepStatus.FAILED)
                     step_exec.end_time = time.time()
                     
                     return {
@@ -881,22 +1127,12 @@ Return ONLY the code, no explanations or markdown formatting."""
         algorithm = algorithm.lower().strip()
         
         # Detect language and extract class name for Java
-        language = 'c'  # default
+        language = _EXT_TO_LANG.get(os.path.splitext(filename or '')[1], 'c')
         java_class_name = None
-        
-        if filename:
-            if filename.endswith('.py'):
-                language = 'python'
-            elif filename.endswith('.java'):
-                language = 'java'
-                # Extract class name from filename (e.g., even_odd.java -> even_odd)
-                java_class_name = filename.replace('.java', '')
-            elif filename.endswith('.js'):
-                language = 'javascript'
-            elif filename.endswith('.cpp'):
-                language = 'cpp'
-            elif filename.endswith('.c'):
-                language = 'c'
+
+        if language == 'java':
+            # Extract class name from filename (e.g., even_odd.java -> even_odd)
+            java_class_name = filename.replace('.java', '')
         
         # Determine complexity level
         complexity = self._get_complexity_level(algorithm)
@@ -965,7 +1201,9 @@ Return ONLY the code, no explanations or markdown formatting."""
             self.logger.warning(f"AI code generation failed for {algorithm}, using fallback: {e}")
             return self._generate_algorithm_fallback(algorithm, language, complexity)
     
-    def _build_generation_prompt(self, algorithm: str, language: str, complexity: str, java_class_name: str = None) -> str:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _build_generation_prompt(algorithm: str, language: str, complexity: str, java_class_name: str = None) -> str:
         """Build adaptive prompt based on complexity level"""
         algo_desc = algorithm.replace('_', ' ')
         
@@ -1020,7 +1258,9 @@ Return ONLY the complete, valid {language} code. No markdown formatting."""
         
         return prompt
     
-    def _get_system_prompt(self, language: str, complexity: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _get_system_prompt(language: str, complexity: str) -> str:
         """Get language and complexity-appropriate system prompt"""
         complexity_text = {
             'simple': 'for simple, readable code',
@@ -1082,193 +1322,19 @@ Return ONLY the complete, valid {language} code. No markdown formatting."""
     
     def _generate_algorithm_fallback(self, algorithm: str, language: str, complexity: str = 'moderate') -> str:
         """Fallback code generation when AI is unavailable"""
-        # Basic fallback templates for common algorithms
-        if language == 'python':
-            if complexity == 'simple':
-                return f'''# {algorithm}
-
-def {algorithm.replace('-', '_')}():
-    print("Implementation of {algorithm}")
-
-if __name__ == "__main__":
-    {algorithm.replace('-', '_')}()
-'''
-            else:
-                return f'''"""
-{algorithm} implementation
-Auto-generated fallback code
-"""
-
-def main():
-    print(f"Implementation of {algorithm}")
-
-if __name__ == "__main__":
-    main()
-'''
-        
-        elif language == 'java':
-            # Extract class name from algorithm, ensuring it matches Java naming conventions
-            class_name = algorithm.replace('_', '')
-            if class_name and class_name[0].isdigit():
-                class_name = 'Algorithm' + class_name
-            if not class_name:
-                class_name = 'Main'
-            
-            if complexity == 'simple':
-                return f'''public class {class_name} {{
-    public static void main(String[] args) {{
-        System.out.println("{algorithm}");
-    }}
-}}
-'''
-            else:
-                return f'''/**
- * {algorithm} implementation
- * Auto-generated fallback code
- */
-public class {class_name} {{
-    
-    /**
-     * Main method
-     */
-    public static void main(String[] args) {{
-        System.out.println("Implementation of {algorithm}");
-    }}
-}}
-'''
-        
-        elif language == 'javascript':
-            if complexity == 'simple':
-                return f'''// {algorithm}
-
-function main() {{
-    console.log("{algorithm}");
-}}
-
-main();
-'''
-            else:
-                return f'''/**
- * {algorithm} implementation
- * Auto-generated fallback code
- */
-
-function main() {{
-    console.log("Implementation of {algorithm}");
-}}
-
-main();
-'''
-        
-        elif language == 'cpp':
-            if complexity == 'simple':
-                return f'''#include <iostream>
-using namespace std;
-
-int main() {{
-    cout << "{algorithm}" << endl;
-    return 0;
-}}
-'''
-            else:
-                return f'''#include <iostream>
-using namespace std;
-
-/**
- * {algorithm} implementation
- * Auto-generated fallback code
- */
-
-int main() {{
-    cout << "Implementation of {algorithm}" << endl;
-    return 0;
-}}
-'''
-        
-        else:  # C
-            if complexity == 'simple':
-                return f'''#include <stdio.h>
-
-int main() {{
-    printf("{algorithm}\\n");
-    return 0;
-}}
-'''
-            else:
-                return f'''#include <stdio.h>
-
-/**
- * {algorithm} implementation
- * Auto-generated fallback code
- */
-
-int main() {{
-    printf("Implementation of {algorithm}\\n");
-    return 0;
-}}
-'''
+        # Unknown languages fall back to C, unknown complexities to the detailed template
+        if language not in _FALLBACK_LANGUAGES:
+            language = 'c'
+        template = _FALLBACK_TEMPLATES.get((language, complexity)) or _FALLBACK_TEMPLATES[(language, 'moderate')]
+        return template.substitute(
+            algorithm=algorithm,
+            func_name=algorithm.replace('-', '_'),
+            class_name=_to_class_name(algorithm)
+        )
     
     def _generate_even_odd_fallback(self, language: str) -> str:
         """Fallback for even/odd code generation"""
-        if language == 'python':
-            return '''#!/usr/bin/env python3
-def check_even_odd(num):
-    return f"{num} is even" if num % 2 == 0 else f"{num} is odd"
-
-if __name__ == "__main__":
-    try:
-        number = int(input("Enter a number: "))
-        print(check_even_odd(number))
-    except ValueError:
-        print("Please enter a valid integer")
-'''
-        elif language == 'java':
-            return '''import java.util.Scanner;
-public class EvenOdd {
-    public static void main(String[] args) {
-        Scanner sc = new Scanner(System.in);
-        try {
-            System.out.print("Enter a number: ");
-            int num = sc.nextInt();
-            System.out.println(num + (num % 2 == 0 ? " is even" : " is odd"));
-        } catch (Exception e) {
-            System.out.println("Invalid input");
-        } finally {
-            sc.close();
-        }
-    }
-}
-'''
-        elif language == 'javascript':
-            return '''const readline = require('readline');
-const rl = readline.createInterface({input: process.stdin, output: process.stdout});
-rl.question('Enter a number: ', (input) => {
-    const num = parseInt(input);
-    console.log(isNaN(num) ? "Invalid input" : num + (num % 2 === 0 ? " is even" : " is odd"));
-    rl.close();
-});
-'''
-        elif language == 'cpp':
-            return '''#include <iostream>
-using namespace std;
-int main() {
-    int num;
-    cout << "Enter a number: ";
-    cin >> num;
-    cout << num << (num % 2 == 0 ? " is even" : " is odd") << endl;
-    return 0;
-}
-'''
-        else:  # C
-            return '''#include <stdio.h>
-int main() {
-    int num;
-    printf("Enter a number: ");
-    scanf("%d", &num);
-    printf("%d is %s\\n", num, num % 2 == 0 ? "even" : "odd");
-    return 0;
-}
-'''
+        return _EVEN_ODD_FALLBACKS.get(language, _EVEN_ODD_FALLBACKS['c'])
     
     def _execute_create_bulk_folders(self, step: ParsedStep) -> Dict[str, Any]:
         """Execute create_bulk_folders step - creates multiple folders with naming pattern"""
@@ -1282,10 +1348,12 @@ int main() {
         created = []
         
         try:
+            # Create the location once, then a single mkdir per folder
+            os.makedirs(location, exist_ok=True)
             for i in range(start, end + 1):
                 folder_name = f"{base_name}{i}"
-                full_path = os.path.join(location, folder_name)
-                os.makedirs(full_path, exist_ok=True)
+                full_path = _pjoin(location, folder_name)
+                _make_dir(full_path)
                 created.append(full_path)
             
             self.logger.info(f"Created {len(created)} bulk folders")
@@ -1328,15 +1396,15 @@ int main() {
                     # Create numbered subfolders
                     for i in range(test_start, test_end + 1):
                         subfolder_name = f"{test_base}{i}"
-                        subfolder_path = os.path.join(parent_path, subfolder_name)
-                        os.makedirs(subfolder_path, exist_ok=True)
+                        subfolder_path = _pjoin(parent_path, subfolder_name)
+                        _make_dir(subfolder_path)
                         created.append(subfolder_path)
                         
             elif isinstance(subfolders, list):
                 # Simple list of subfolder names
                 for subfolder in subfolders:
-                    subfolder_path = os.path.join(parent_path, subfolder)
-                    os.makedirs(subfolder_path, exist_ok=True)
+                    subfolder_path = _pjoin(parent_path, subfolder)
+                    _make_dir(subfolder_path)
                     created.append(subfolder_path)
             
             self.logger.info(f"Created nested folder structure with {len(created)} folders total")
@@ -1416,47 +1484,59 @@ int main() {
             raise Exception(f"Unknown downloader action: {step.action}")
         
     def _group_steps_for_execution(self) -> List[List[StepExecution]]:
-        """Group steps for optimal execution order"""
+        """Group steps into dependency levels using Kahn's topological sort"""
+        step_count = len(self.step_executions)
+        indegree = [0] * step_count
+        dependents = defaultdict(list)
+        
+        for index, step_exec in enumerate(self.step_executions):
+            for dep_index in set(step_exec.step.dependencies or ()):
+                # Out-of-range dependencies are never satisfied
+                indegree[index] += 1
+                if 0 <= dep_index < step_count:
+                    dependents[dep_index].append(index)
+        
         groups = []
-        remaining_steps = self.step_executions.copy()
+        placed = [False] * step_count
+        ready = [index for index in range(step_count) if indegree[index] == 0]
+        remaining = step_count
+        next_unplaced = 0
         
-        while remaining_steps:
-            current_group = []
+        while remaining:
+            if not ready:
+                # If no steps can be executed, there might be circular dependencies
+                # Run the first remaining step on its own to break the cycle
+                while placed[next_unplaced]:
+                    next_unplaced += 1
+                ready = [next_unplaced]
             
-            # Find steps that can be executed (no unmet dependencies)
-            for step_exec in remaining_steps[:]:
-                if self._can_execute_step(step_exec, [s.step for group in groups for s in group]):
-                    current_group.append(step_exec)
-                    remaining_steps.remove(step_exec)
+            ready.sort()
+            for index in ready:
+                placed[index] = True
             
-            if not current_group:
-                # If no steps can be executed, there might be circular dependencies
-                # Add the first remaining step to break the cycle
-                current_group.append(remaining_steps.pop(0))
+            next_ready = []
+            for index in ready:
+                for dependent in dependents[index]:
+                    indegree[dependent] -= 1
+                    if indegree[dependent] == 0 and not placed[dependent]:
+                        next_ready.append(dependent)
             
-            groups.append(current_group)
+            groups.append([self.step_executions[index] for index in ready])
+            remaining -= len(ready)
+            ready = next_ready
         
         return groups
     
-    def _can_execute_step(self, step_exec: StepExecution, completed_steps: List[ParsedStep]) -> bool:
-        """Check if a step can be executed based on dependencies"""
-        if not step_exec.step.dependencies:
-            return True
-        
-        completed_indices = [i for i, step in enumerate(self.current_workflow.steps) if step in completed_steps]
-        
-        for dep_index in step_exec.step.dependencies:
-            if dep_index not in completed_indices:
-                return False
-        
-        return True
-    
     def _execute_step_group(self, group: List[StepExecution]) -> List[Dict[str, Any]]:
         """Execute a group of steps, potentially in parallel"""
         if len(group) == 1:
             # Single step, execute directly
             return [self._execute_step(group[0])]
         
+        # Threads only help when at least two steps block on I/O (CPU-bound steps hold the GIL)
+        if sum(1 for step_exec in group if step_exec.step.io_bound) < 2:
+            return [self._execute_step(step_exec) for step_exec in group]
+        
         # Multiple steps, execute in parallel if safe
         if len(group) <= self.max_parallel_steps:
             return self._execute_parallel_steps(group)
@@ -1465,42 +1545,39 @@ int main() {
             return [self._execute_step(step_exec) for step_exec in group]
     
     def _execute_parallel_steps(self, steps: List[StepExecution]) -> List[Dict[str, Any]]:
-        """Execute steps in parallel using ThreadPoolExecutor"""
+        """Execute steps in parallel on the engine's ThreadPoolExecutor"""
         results = []
         
-        with ThreadPoolExecutor(max_workers=min(len(steps), self.max_parallel_steps)) as executor:
-            # Submit all steps
-            future_to_step = {executor.submit(self._execute_step, step_exec): step_exec for step_exec in steps}
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_step):
-                step_exec = future_to_step[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    results.append({
-                        'success': False,
-                        'error': str(e),
-                        'step_action': step_exec.step.action
-                    })
+        # Submit all steps to the shared pool
+        future_to_step = {self._executor.submit(self._execute_step, step_exec): step_exec for step_exec in steps}
+        
+        # Collect results as they complete
+        for future in as_completed(future_to_step):
+            step_exec = future_to_step[future]
+            try:
+                result = future.result()
+                results.append(result)
+            except Exception as e:
+                results.append({
+                    'success': False,
+                    'error': str(e),
+                    'step_action': step_exec.step.action
+                })
         
         return results
     
+    @staticmethod
+    def _dependency_mask(step: ParsedStep, step_count: int) -> int:
+        """Build the bitmask of step indices a step depends on"""
+        mask = 0
+        for dep_index in step.dependencies or ():
+            # Invalid indices map to a bit no step can set, so they never resolve
+            mask |= 1 << (dep_index if 0 <= dep_index < step_count else step_count)
+        return mask
+    
     def _check_dependencies(self, step_exec: StepExecution) -> bool:
         """Check if step dependencies are satisfied"""
-        if not step_exec.step.dependencies:
-            return True
-        
-        for dep_index in step_exec.step.dependencies:
-            if dep_index >= len(self.step_executions):
-                return False
-            
-            dep_step = self.step_executions[dep_index]
-            if dep_step.status != StepStatus.COMPLETED:
-                return False
-        
-        return True
+        return (step_exec.dep_mask & self._completed_mask) == step_exec.dep_mask
     
     def _evaluate_conditions(self, conditions: List[str]) -> bool:
         """Evaluate step conditions"""
@@ -1525,6 +1602,9 @@ int main() {
     
     def _notify_progress(self, current_group: int, total_groups: int, group_results: List[Dict[str, Any]]):
         """Notify progress callbacks"""
+        if not self.progress_callbacks:
+            return
+        
         progress_info = {
             'current_group': current_group,
             'total_groups': total_groups,
@@ -1535,33 +1615,62 @@ int main() {
         for callback in self.progress_callbacks:
             try:
                 callback(progress_info)
-            except Exception as e:
-                self.logger.error(f"Progress callback error: {e}")
+            except Exception:
+                self.logger.exception("Progress callback error")
+    
+    def _set_status(self, step_exec: StepExecution, status: StepStatus):
+        """Transition a step to a new status and update the aggregate counters"""
+        with self._status_lock:
+            if step_exec.status is StepStatus.COMPLETED:
+                self._completed_mask &= ~(1 << step_exec.index)
+            elif step_exec.status is StepStatus.FAILED:
+                self._failed_mask &= ~(1 << step_exec.index)
+            elif step_exec.status is StepStatus.RUNNING:
+                self._running_steps.pop(step_exec.index, None)
+            self._status_counts[step_exec.status] -= 1
+            self._status_counts[status] += 1
+            step_exec.status = status
+            if status is StepStatus.COMPLETED:
+                self._completed_mask |= 1 << step_exec.index
+            elif status is StepStatus.RUNNING:
+                self._running_steps[step_exec.index] = step_exec
+            elif status is StepStatus.FAILED:
+                self._failed_mask |= 1 << step_exec.index
     
     def _get_completed_steps(self) -> List[str]:
-        """Get list of completed step actions"""
-        return [step_exec.step.action for step_exec in self.step_executions if step_exec.status == StepStatus.COMPLETED]
+        """Get list of completed step actions, in step order"""
+        mask, steps = self._completed_mask, self.step_executions
+        completed = []
+        while mask:
+            low = mask & -mask
+            completed.append(steps[low.bit_length() - 1].step.action)
+            mask ^= low
+        return completed
     
     def _get_failed_step(self) -> Optional[str]:
-        """Get the first failed step action"""
-        for step_exec in self.step_executions:
-            if step_exec.status == StepStatus.FAILED:
-                return step_exec.step.action
-        return None
+        """Get the first failed step action, in step order"""
+        mask = self._failed_mask
+        if not mask:
+            return None
+        return self.step_executions[(mask & -mask).bit_length() - 1].step.action
     
     def _generate_execution_summary(self) -> Dict[str, Any]:
         """Generate execution summary"""
-        status_counts = {}
-        for status in StepStatus:
-            status_counts[status.value] = sum(1 for step_exec in self.step_executions if step_exec.status == status)
+        counts = self._status_counts
+        steps = self.step_executions
+        status_counts = {status.value: counts[status] for status in StepStatus}
         
         return {
-            'total_steps': len(self.step_executions),
+            'total_steps': len(steps),
             'status_breakdown': status_counts,
-            'success_rate': (status_counts.get('completed', 0) / len(self.step_executions)) * 100 if self.step_executions else 0,
-            'total_retries': sum(step_exec.retry_count for step_exec in self.step_executions)
+            'success_rate': (status_counts.get('completed', 0) / len(steps)) * 100 if steps else 0,
+            'total_retries': sum(step_exec.retry_count for step_exec in steps)
         }
     
+    def shutdown(self):
+        """Release the parallel step worker pool"""
+        self._executor.shutdown(wait=False)
+    
     def add_progress_callback(self, callback: Callable):
         """Add a progress callback function"""
         self.progress_callbacks.append(callback)
@@ -1571,49 +1680,48 @@ int main() {
         if not self.current_workflow:
             return {'status': 'idle'}
         
+        # At most max_parallel_steps entries; the lowest index matches step order
+        with self._status_lock:
+            running = self._running_steps
+            current_step = running[min(running)].step.action if running else None
+        
         return {
-            'status': 'running' if any(step.status == StepStatus.RUNNING for step in self.step_executions) else 'completed',
+            'status': 'running' if running else 'completed',
             'original_command': self.current_workflow.original_command,
             'complexity': self.current_workflow.complexity.value,
             'progress': self._generate_execution_summary(),
-            'current_step': next((step.step.action for step in self.step_executions if step.status == StepStatus.RUNNING), None)
+            'current_step': current_step
         }
     
     def _resolve_paths(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Resolve special path names to actual paths"""
-        import os
-        
         resolved_params = params.copy()
-        
-        # Common path mappings
-        path_mappings = {
-            'desktop': os.path.join(os.path.expanduser('~'), 'Desktop'),
-            'documents': os.path.join(os.path.expanduser('~'), 'Documents'),
-            'downloads': os.path.join(os.path.expanduser('~'), 'Downloads'),
-            'home': os.path.expanduser('~'),
-            'current': os.getcwd(),
-            'temp': os.path.join(os.path.expanduser('~'), 'AppData', 'Local', 'Temp') if os.name == 'nt' else '/tmp'
-        }
-        
-        # Resolve location parameter
-        if 'location' in resolved_params:
-            location = resolved_params['location']
-            if isinstance(location, str):
-                location_lower = location.lower()
-                if location_lower in path_mappings:
-                    resolved_params['location'] = path_mappings[location_lower]
-                elif location_lower.startswith('desktop/') or location_lower.startswith('desktop\\'):
+        location = params.get('location')
+        path = params.get('path')
+        
+        # Resolve location parameter; anything without lower() is left alone
+        lower = getattr(location, 'lower', None)
+        if lower is not None:
+            # Exact (already lowercase) names skip the lower() call
+            mapped = _PATH_MAPPINGS.get(location)
+            if mapped is None:
+                location_lower = lower()
+                mapped = os.getcwd() if location_lower == 'current' else _PATH_MAPPINGS.get(location_lower)
+                if mapped is None and location_lower[:_DESKTOP_PREFIX_LEN] in _DESKTOP_PREFIXES:
                     # Handle paths like "Desktop/FolderName"
-                    desktop_path = path_mappings['desktop']
-                    relative_path = location[8:]  # Remove "Desktop/"
-                    resolved_params['location'] = os.path.join(desktop_path, relative_path)
+                    relative_path = location[_DESKTOP_PREFIX_LEN:]  # Remove "Desktop/"
+                    mapped = _pjoin(_DESKTOP, relative_path)
+            if mapped is not None:
+                resolved_params['location'] = mapped
         
         # Resolve path parameter
-        if 'path' in resolved_params:
-            path = resolved_params['path']
-            if isinstance(path, str):
-                path_lower = path.lower()
-                if path_lower in path_mappings:
-                    resolved_params['path'] = path_mappings[path_lower]
+        lower = getattr(path, 'lower', None)
+        if lower is not None:
+            mapped = _PATH_MAPPINGS.get(path)
+            if mapped is None:
+                path_lower = lower()
+                mapped = os.getcwd() if path_lower == 'current' else _PATH_MAPPINGS.get(path_lower)
+            if mapped is not None:
+                resolved_params['path'] = mapped
         
         return resolved_params
\ No newline at end of file
@@ -2,33 +2,67 @@
 Factory for creating OS-specific adapters
 """
 
-import platform
-from typing import Any
+import atexit
+import sys
+import threading
+from typing import Dict
 
 from .base_adapter import BaseOSAdapter
-from .windows_adapter import WindowsAdapter
-from .linux_adapter import LinuxAdapter
-from .macos_adapter import MacOSAdapter
+
+
+# The platform cannot change at runtime, so pick the adapter class once and
+# only import the module for this platform
+if sys.platform.startswith('win'):
+    from .windows_adapter import WindowsAdapter as _ADAPTER_CLS
+elif sys.platform.startswith('linux'):
+    from .linux_adapter import LinuxAdapter as _ADAPTER_CLS
+elif sys.platform == 'darwin':  # macOS
+    from .macos_adapter import MacOSAdapter as _ADAPTER_CLS
+else:
+    _ADAPTER_CLS = None
 
 
 class OSAdapterFactory:
     """Factory class for creating appropriate OS adapters"""
     
-    @staticmethod
-    def create_adapter() -> BaseOSAdapter:
-        """Create an OS adapter based on the current platform"""
-        system = platform.system().lower()
+    # Process-wide adapters shared by every caller of create_adapter(), one per class
+    _instances: Dict[type, BaseOSAdapter] = {}
+    _lock = threading.Lock()
+    
+    @classmethod
+    def create_adapter(cls, enhanced: bool = False) -> BaseOSAdapter:
+        """Get the OS adapter for the current platform, creating it on first use"""
+        if _ADAPTER_CLS is None:
+            raise NotImplementedError(f"OS '{sys.platform}' is not supported")
+        adapter_cls = _ADAPTER_CLS
+        if enhanced and sys.platform.startswith('win'):
+            # Registry/service/task/firewall operations; needs pywin32, so only
+            # imported when asked for. The flag is ignored on other platforms.
+            from .enhanced_windows_adapter import EnhancedWindowsAdapter
+            adapter_cls = EnhancedWindowsAdapter
         
-        if system == 'windows':
-            return WindowsAdapter()
-        elif system == 'linux':
-            return LinuxAdapter()
-        elif system == 'darwin':  # macOS
-            return MacOSAdapter()
-        else:
-            raise NotImplementedError(f"OS '{system}' is not supported")
+        adapter = cls._instances.get(adapter_cls)
+        if adapter is None:
+            with cls._lock:
+                adapter = cls._instances.get(adapter_cls)
+                if adapter is None:
+                    adapter = cls._instances[adapter_cls] = adapter_cls()
+        return adapter
+    
+    @classmethod
+    def reset_adapter(cls):
+        """Clean up and drop the shared adapters so the next call creates fresh ones"""
+        with cls._lock:
+            adapters = list(cls._instances.values())
+            cls._instances.clear()
+        for adapter in adapters:
+            adapter.cleanup()
     
     @staticmethod
     def get_supported_platforms() -> list:
         """Get list of supported platforms"""
         return ['windows', 'linux', 'darwin']
+
+
+# Shared adapters outlive any single engine, so release them when the process exits
+atexit.register(OSAdapterFactory.reset_adapter)
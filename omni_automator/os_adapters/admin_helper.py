@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Elevated helper process that runs admin commands for EnhancedWindowsAdapter
+
+Started once with the "runas" verb, it serves a named pipe so later admin
+operations need no further elevation. Usage:
+
+    python -m omni_automator.os_adapters.admin_helper <pipe name> <parent pid> <parent user SID>
+"""
+
+import sys
+import json
+import subprocess
+import pywintypes
+import win32file
+import win32pipe
+import win32security
+import winerror
+
+_BUFFER_SIZE = 64 * 1024
+_COMMAND_TIMEOUT = 30  # Seconds
+_CREATE_NO_WINDOW = 0x08000000
+
+
+def _pipe_sddl(user_sid: str) -> str:
+    """Security descriptor letting only the (non-elevated) launching user use the pipe"""
+    # Read/write for that user, with a Medium integrity no-write-up label so a
+    # Medium integrity client can open a pipe created by a High integrity process
+    return f'D:(A;;GRGW;;;{user_sid})S:(ML;;NW;;;ME)'
+
+
+def read_message(handle) -> bytes:
+    """Read one whole message from a message-mode pipe"""
+    chunks = []
+    while True:
+        hr, data = win32file.ReadFile(handle, _BUFFER_SIZE)
+        chunks.append(data)
+        if hr != winerror.ERROR_MORE_DATA:
+            return b''.join(chunks)
+
+
+def write_message(handle, payload: dict):
+    """Write one JSON message to a message-mode pipe"""
+    win32file.WriteFile(handle, json.dumps(payload).encode('utf-8'))
+
+
+def run_command(command) -> dict:
+    """Run an argv list directly, or a command string through the shell"""
+    try:
+        result = subprocess.run(command, shell=isinstance(command, str), capture_output=True, text=True,
+                                timeout=_COMMAND_TIMEOUT, creationflags=_CREATE_NO_WINDOW)
+        return {
+            'success': result.returncode == 0,
+            'output': result.stdout,
+            'error': result.stderr,
+            'return_code': result.returncode
+        }
+    except Exception as e:
+        return {
+            'success': False,
+            'error': f"Failed to run command: {e}",
+            'return_code': -1
+        }
+
+
+def run_sequence(run, commands) -> dict:
+    """Run argv lists one after another with run(), stopping at the first failure"""
+    result = {'success': True, 'return_code': 0}
+    outputs, errors = [], []
+    for command in commands:
+        result = run(command)
+        outputs.append(result.get('output', ''))
+        errors.append(result.get('error', ''))
+        if not result.get('success'):
+            break
+    return {**result, 'output': ''.join(outputs), 'error': ''.join(errors)}
+
+
+def serve(pipe_name: str, parent_pid: int, user_sid: str):
+    """Serve commands from the parent process until it disconnects"""
+    security = pywintypes.SECURITY_ATTRIBUTES()
+    security.SECURITY_DESCRIPTOR = win32security.ConvertStringSecurityDescriptorToSecurityDescriptor(
+        _pipe_sddl(user_sid), win32security.SDDL_REVISION_1
+    )
+    # Single local instance; fails if someone else already created the name
+    pipe = win32pipe.CreateNamedPipe(
+        pipe_name,
+        win32pipe.PIPE_ACCESS_DUPLEX | win32file.FILE_FLAG_FIRST_PIPE_INSTANCE,
+        win32pipe.PIPE_TYPE_MESSAGE | win32pipe.PIPE_READMODE_MESSAGE | win32pipe.PIPE_WAIT
+        | win32pipe.PIPE_REJECT_REMOTE_CLIENTS,
+        1, _BUFFER_SIZE, _BUFFER_SIZE, 0, security
+    )
+    try:
+        win32pipe.ConnectNamedPipe(pipe, None)
+        # Only the process that launched us may drive an elevated shell
+        if win32pipe.GetNamedPipeClientProcessId(pipe) != parent_pid:
+            return
+
+        while True:
+            try:
+                request = json.loads(read_message(pipe))
+            except pywintypes.error:
+                return  # Parent closed the pipe
+            if 'commands' in request:
+                # A list of argv lists, each run without a shell
+                reply = run_sequence(run_command, [list(command) for command in request['commands']])
+            else:
+                reply = run_command(request['command'])
+            write_message(pipe, reply)
+    finally:
+        win32file.CloseHandle(pipe)
+
+
+if __name__ == '__main__':
+    serve(sys.argv[1], int(sys.argv[2]), sys.argv[3])
@@ -2,193 +2,236 @@
 Base OS adapter interface that all platform-specific adapters must implement
 """
 
-from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+import threading
+import time
+from typing import Dict, Any, List, Callable
 
 
-class BaseModuleAdapter(ABC):
+class BaseModuleAdapter:
     """Base class for OS module adapters (filesystem, process, etc.)"""
     
-    @abstractmethod
+    # No per-instance __dict__ unless a concrete adapter leaves out __slots__
+    __slots__ = ()
+    
+    # Action name -> handler(adapter, params), filled in by concrete adapters
+    _ACTIONS: Dict[str, Callable[[Any, Dict[str, Any]], Any]] = {}
+    _ACTION_KIND = 'module'
+    
     def execute(self, action: str, params: Dict[str, Any]) -> Any:
         """Execute an action with given parameters"""
-        pass
+        handler = self._ACTIONS.get(action)
+        if handler is None:
+            raise ValueError(f"Unknown {self._ACTION_KIND} action: {action}")
+        return handler(self, params)
     
-    @abstractmethod
     def get_capabilities(self) -> List[str]:
         """Get list of supported actions"""
-        pass
+        raise NotImplementedError
 
 
 class BaseFilesystemAdapter(BaseModuleAdapter):
     """Base filesystem operations adapter"""
     
-    @abstractmethod
+    __slots__ = ()
+    _ACTION_KIND = 'filesystem'
+    
     def create_folder(self, path: str, parents: bool = True) -> bool:
         """Create a folder"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def create_file(self, path: str, content: str = "") -> bool:
         """Create a file"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def delete(self, path: str, recursive: bool = False) -> bool:
         """Delete file or folder"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def copy(self, source: str, destination: str) -> bool:
         """Copy file or folder"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def move(self, source: str, destination: str) -> bool:
         """Move file or folder"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def list_directory(self, path: str) -> List[Dict[str, Any]]:
         """List directory contents"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def get_file_info(self, path: str) -> Dict[str, Any]:
         """Get file/folder information"""
-        pass
+        raise NotImplementedError
 
 
 class BaseProcessAdapter(BaseModuleAdapter):
     """Base process management adapter"""
     
-    @abstractmethod
+    __slots__ = ()
+    _ACTION_KIND = 'process'
+    
     def start_process(self, program: str, args: List[str] = None) -> int:
         """Start a new process"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def terminate_process(self, pid_or_name: Any) -> bool:
         """Terminate a process by PID or name"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def list_processes(self) -> List[Dict[str, Any]]:
         """List running processes"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def get_process_info(self, pid: int) -> Dict[str, Any]:
         """Get process information"""
-        pass
+        raise NotImplementedError
 
 
 class BaseGUIAdapter(BaseModuleAdapter):
     """Base GUI automation adapter"""
     
-    @abstractmethod
+    __slots__ = ()
+    _ACTION_KIND = 'GUI'
+    
     def click(self, x: int, y: int, button: str = 'left') -> bool:
         """Click at coordinates"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def type_text(self, text: str) -> bool:
         """Type text"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def press_key(self, key: str) -> bool:
         """Press a key"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def take_screenshot(self, filename: str = None) -> str:
         """Take screenshot"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def find_element(self, image_path: str) -> Dict[str, int]:
         """Find element by image"""
-        pass
+        raise NotImplementedError
+    
+    def wait(self, seconds: float) -> bool:
+        """Pause for the given number of seconds"""
+        time.sleep(seconds)
+        return True
 
 
 class BaseSystemAdapter(BaseModuleAdapter):
     """Base system operations adapter"""
     
-    @abstractmethod
+    __slots__ = ()
+    _ACTION_KIND = 'system'
+    
     def get_system_info(self) -> Dict[str, Any]:
         """Get system information"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def set_volume(self, level: int) -> bool:
         """Set system volume"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def power_action(self, action: str) -> bool:
         """Perform power action (shutdown, restart, etc.)"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def get_environment_variables(self) -> Dict[str, str]:
         """Get environment variables"""
-        pass
+        raise NotImplementedError
 
 
 class BaseNetworkAdapter(BaseModuleAdapter):
     """Base network operations adapter"""
     
-    @abstractmethod
+    __slots__ = ()
+    _ACTION_KIND = 'network'
+    
     def download_file(self, url: str, filename: str = None) -> str:
         """Download file from URL"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def http_request(self, method: str, url: str, **kwargs) -> Dict[str, Any]:
         """Make HTTP request"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def get_network_info(self) -> Dict[str, Any]:
         """Get network information"""
-        pass
+        raise NotImplementedError
 
 
-class BaseOSAdapter(ABC):
+class BaseOSAdapter:
     """Base OS adapter that coordinates all module adapters"""
     
+    __slots__ = ('_filesystem', '_process', '_gui', '_system', '_network', '_adapter_lock')
+    
     def __init__(self):
-        self.filesystem = self._create_filesystem_adapter()
-        self.process = self._create_process_adapter()
-        self.gui = self._create_gui_adapter()
-        self.system = self._create_system_adapter()
-        self.network = self._create_network_adapter()
+        # Module adapters are created on first access, so e.g. a filesystem-only
+        # workflow never pays for GUI or network setup
+        self._filesystem = None
+        self._process = None
+        self._gui = None
+        self._system = None
+        self._network = None
+        # Parallel workflow steps may touch the same adapter for the first time together
+        self._adapter_lock = threading.RLock()
+    
+    def _module_adapter(self, attr: str, create: Callable[[], Any]):
+        """Return the module adapter in slot attr, creating it exactly once"""
+        adapter = getattr(self, attr)
+        if adapter is None:
+            with self._adapter_lock:
+                adapter = getattr(self, attr)
+                if adapter is None:
+                    adapter = create()
+                    setattr(self, attr, adapter)
+        return adapter
+    
+    @property
+    def filesystem(self) -> BaseFilesystemAdapter:
+        """Filesystem adapter, created on first use"""
+        return self._module_adapter('_filesystem', self._create_filesystem_adapter)
+    
+    @property
+    def process(self) -> BaseProcessAdapter:
+        """Process adapter, created on first use"""
+        return self._module_adapter('_process', self._create_process_adapter)
+    
+    @property
+    def gui(self) -> BaseGUIAdapter:
+        """GUI adapter, created on first use"""
+        return self._module_adapter('_gui', self._create_gui_adapter)
+    
+    @property
+    def system(self) -> BaseSystemAdapter:
+        """System adapter, created on first use"""
+        return self._module_adapter('_system', self._create_system_adapter)
+    
+    @property
+    def network(self) -> BaseNetworkAdapter:
+        """Network adapter, created on first use"""
+        return self._module_adapter('_network', self._create_network_adapter)
     
-    @abstractmethod
     def _create_filesystem_adapter(self) -> BaseFilesystemAdapter:
         """Create filesystem adapter"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def _create_process_adapter(self) -> BaseProcessAdapter:
         """Create process adapter"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def _create_gui_adapter(self) -> BaseGUIAdapter:
         """Create GUI adapter"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def _create_system_adapter(self) -> BaseSystemAdapter:
         """Create system adapter"""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def _create_network_adapter(self) -> BaseNetworkAdapter:
         """Create network adapter"""
-        pass
+        raise NotImplementedError
     
     def cleanup(self):
         """Cleanup adapter resources"""
@@ -5,6 +5,7 @@ Enhanced Windows OS Adapter with deep system integration
 
 import os
 import sys
+import atexit
 import subprocess
 import winreg
 import ctypes
@@ -14,16 +15,305 @@ import win32api
 import win32con
 import win32gui
 import win32process
+import uuid
+import pywintypes
+import win32event
+import win32file
+import win32pipe
+import win32security
 import win32service
 import win32serviceutil
-from typing import Dict, List, Any, Optional
+import pythoncom
+import win32com.client
+from typing import Dict, List, Any, Optional, Iterator, Union
+import csv
+import io
 import json
 import time
+import threading
+from datetime import date
+from functools import lru_cache
+from types import MappingProxyType
+import heapq
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .base_adapter import BaseOSAdapter
+from .admin_helper import read_message, write_message, run_sequence
 from ..utils.logger import get_logger
 
+
+# ShellExecuteExW constants used to launch elevated commands
+_SEE_MASK_NOCLOSEPROCESS = 0x00000040
+_SEE_MASK_NOASYNC = 0x00000100
+_SW_HIDE = 0
+_WAIT_TIMEOUT = 0x00000102
+_ENV_BROADCAST_DELAY = 0.25  # Seconds; back-to-back single sets share one broadcast
+# Connecting to the helper pipe is retried only while it is not created yet or busy;
+# WaitNamedPipe reports a busy pipe that stays busy as a semaphore timeout
+_ERROR_FILE_NOT_FOUND = 2
+_ERROR_SEM_TIMEOUT = 121
+_ERROR_PIPE_BUSY = 231
+_PIPE_RETRY_ERRORS = (_ERROR_FILE_NOT_FOUND, _ERROR_SEM_TIMEOUT, _ERROR_PIPE_BUSY)
+# Directory containing the omni_automator package, for `python -m` in the helper
+_PACKAGE_PARENT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_COMMAND_TIMEOUT = 30  # Seconds
+_CREATE_NO_WINDOW = 0x08000000
+_ERROR_NO_MORE_ITEMS = 259
+_DRIVE_FIXED = 3  # GetDriveTypeW result for a local disk
+_CPU_FREQ_TTL = 2.0  # Seconds
+# Module/procedure not found, or not supported: no Kernel Transaction Manager
+_KTM_UNAVAILABLE_ERRORS = (None, 50, 126, 127)
+
+# Registry views holding installed software; a 32-bit OS has only one view
+_IS_64BIT_OS = (os.environ.get('PROCESSOR_ARCHITECTURE', '').endswith('64')
+                or 'PROCESSOR_ARCHITEW6432' in os.environ)
+_SOFTWARE_VIEWS = ((winreg.KEY_WOW64_64KEY, winreg.KEY_WOW64_32KEY) if _IS_64BIT_OS
+                   else (winreg.KEY_WOW64_64KEY,))
+
+
+# Registry root key names accepted in key paths
+_ROOT_KEYS = MappingProxyType({
+    'HKEY_CURRENT_USER': winreg.HKEY_CURRENT_USER,
+    'HKEY_LOCAL_MACHINE': winreg.HKEY_LOCAL_MACHINE,
+    'HKEY_CLASSES_ROOT': winreg.HKEY_CLASSES_ROOT,
+    'HKEY_USERS': winreg.HKEY_USERS,
+    'HKEY_CURRENT_CONFIG': winreg.HKEY_CURRENT_CONFIG,
+    'HKCU': winreg.HKEY_CURRENT_USER,
+    'HKLM': winreg.HKEY_LOCAL_MACHINE,
+})
+
+# RegNotifyChangeKeyValue filter: value changes, and keep the registration alive
+# even if the registering thread exits (REG_NOTIFY_THREAD_AGNOSTIC, Windows 8+)
+_REG_NOTIFY_CHANGE_LAST_SET = 0x00000004
+_REG_NOTIFY_THREAD_AGNOSTIC = 0x10000000
+
+
+def _read_registry_values(key) -> Dict[str, Dict[str, Any]]:
+    """Read every value of an open registry key"""
+    values = {}
+    # The value count bounds the loop instead of waiting for the end-of-list error
+    for i in range(winreg.QueryInfoKey(key)[1]):
+        try:
+            name, value, reg_type = winreg.EnumValue(key, i)
+        except OSError:
+            break  # Values were removed while enumerating
+        values[name] = {'value': value, 'type': reg_type}
+    return values
+
+
+class _WatchedRegistryKey:
+    """Cached values of a registry key, re-read only after the key changes"""
+    
+    def __init__(self, root_key, subkey_path: str):
+        self._root_key = root_key
+        self._subkey_path = subkey_path
+        self._lock = threading.Lock()
+        self._key = None
+        self._event = None
+        self._values: Optional[Dict[str, Dict[str, Any]]] = None
+    
+    def values(self) -> Dict[str, Dict[str, Any]]:
+        """Get the key's values, refreshing them if a change was signalled"""
+        with self._lock:
+            if self._values is None or win32event.WaitForSingleObject(self._event, 0) == win32event.WAIT_OBJECT_0:
+                if self._key is None:
+                    self._key = winreg.OpenKey(self._root_key, self._subkey_path, 0, winreg.KEY_READ)
+                    self._event = win32event.CreateEvent(None, False, False, None)
+                # Re-arm before reading so a change made during the read is not missed
+                status = ctypes.windll.advapi32.RegNotifyChangeKeyValue(
+                    self._key.handle, False, _REG_NOTIFY_CHANGE_LAST_SET | _REG_NOTIFY_THREAD_AGNOSTIC,
+                    int(self._event), True
+                )
+                values = _read_registry_values(self._key)
+                # Without a notification there is nothing to invalidate the cache
+                self._values = values if status == 0 else None
+                return values
+            return self._values
+    
+    def close(self):
+        """Release the key and event handles"""
+        with self._lock:
+            if self._key is not None:
+                self._key.Close()
+                self._event.Close()
+                self._key = self._event = None
+            self._values = None
+
+
+# Task Scheduler 2.0 COM constants
+_TASK_TRIGGER_TYPES = {
+    'ONCE': 1,      # TASK_TRIGGER_TIME
+    'DAILY': 2,     # TASK_TRIGGER_DAILY
+    'WEEKLY': 3,    # TASK_TRIGGER_WEEKLY
+    'MONTHLY': 4,   # TASK_TRIGGER_MONTHLY
+    'ONSTART': 8,   # TASK_TRIGGER_BOOT
+    'ONLOGON': 9,   # TASK_TRIGGER_LOGON
+}
+_TASK_ACTION_EXEC = 0
+_TASK_CREATE_OR_UPDATE = 6
+_TASK_LOGON_INTERACTIVE_TOKEN = 3
+_TASK_ENUM_HIDDEN = 1
+_TASK_STATES = {0: 'unknown', 1: 'disabled', 2: 'queued', 3: 'ready', 4: 'running'}
+# Column order of `schtasks /query /fo csv /nh`; headers are localized, so they are not parsed
+_SCHTASKS_CSV_FIELDS = ('name', 'next_run', 'state')
+_E_ACCESSDENIED = -2147024891  # 0x80070005 as a signed HRESULT
+_ALL_MONTHS = 0xFFF  # MonthsOfYear bits for January..December
+
+
+def _task_trigger_fields(schedule: str, time_str: str, today: date) -> Dict[str, Any]:
+    """Trigger properties for a schedule, matching what schtasks /create would set"""
+    # StartBoundary needs a zero-padded hour ('9:00' -> '09:00:00')
+    hour, minute = (int(part) for part in time_str.split(':')[:2])
+    fields: Dict[str, Any] = {'StartBoundary': f'{today.isoformat()}T{hour:02d}:{minute:02d}:00'}
+    if schedule == 'DAILY':
+        fields['DaysInterval'] = 1
+    elif schedule == 'WEEKLY':
+        # schtasks defaults to today's weekday; DaysOfWeek bit 0 is Sunday
+        fields['WeeksInterval'] = 1
+        fields['DaysOfWeek'] = 1 << (today.isoweekday() % 7)
+    elif schedule == 'MONTHLY':
+        # schtasks defaults to day 1 of every month
+        fields['DaysOfMonth'] = 1
+        fields['MonthsOfYear'] = _ALL_MONTHS
+    return fields
+
+
+def _firewall_rule_commands(rules: List[Dict[str, Any]]) -> List[List[str]]:
+    """Build netsh argv lists for rules, merging only rules that differ in local port"""
+    # Remote address is part of the key: merging across different remote_ip values
+    # would allow every merged port from every merged address
+    groups: Dict[tuple, List[str]] = {}
+    for rule in rules:
+        program = rule.get('program', '')
+        port = rule.get('port', '')
+        if not program and not port:
+            raise ValueError('Must specify either program or port')
+        
+        key = (
+            rule.get('rule_name', 'OmniAutomator Rule'),
+            rule.get('direction', 'in'),
+            rule.get('action', 'allow'),
+            '' if program else rule.get('protocol', 'TCP'),
+            program,
+            str(rule.get('remote_ip') or ''),
+        )
+        ports = groups.setdefault(key, [])
+        if port and not program and str(port) not in ports:
+            ports.append(str(port))
+    
+    if not groups:
+        raise ValueError('No firewall rules given')
+    
+    commands = []
+    for (rule_name, direction, action, protocol, program, remote_ip), ports in groups.items():
+        cmd = ['netsh', 'advfirewall', 'firewall', 'add', 'rule',
+               f'name={rule_name}', f'dir={direction}', f'action={action}']
+        if program:
+            cmd.append(f'program={program}')
+        else:
+            cmd += [f'protocol={protocol}', f'localport={",".join(ports)}']
+        if remote_ip:
+            cmd.append(f'remoteip={remote_ip}')
+        commands.append(cmd)
+    return commands
+
+
+class _SHELLEXECUTEINFOW(ctypes.Structure):
+    _fields_ = [
+        ('cbSize', wintypes.DWORD),
+        ('fMask', ctypes.c_ulong),
+        ('hwnd', wintypes.HWND),
+        ('lpVerb', wintypes.LPCWSTR),
+        ('lpFile', wintypes.LPCWSTR),
+        ('lpParameters', wintypes.LPCWSTR),
+        ('lpDirectory', wintypes.LPCWSTR),
+        ('nShow', ctypes.c_int),
+        ('hInstApp', wintypes.HINSTANCE),
+        ('lpIDList', ctypes.c_void_p),
+        ('lpClass', wintypes.LPCWSTR),
+        ('hkeyClass', wintypes.HKEY),
+        ('dwHotKey', wintypes.DWORD),
+        ('hIconOrMonitor', wintypes.HANDLE),
+        ('hProcess', wintypes.HANDLE),
+    ]
+
+
+# Well-known BUILTIN\Administrators SID components
+_SECURITY_NT_AUTHORITY = (0, 0, 0, 0, 0, 5)
+_SECURITY_BUILTIN_DOMAIN_RID = 0x20
+_DOMAIN_ALIAS_RID_ADMINS = 0x220
+
+
+class _SID_IDENTIFIER_AUTHORITY(ctypes.Structure):
+    _fields_ = [('Value', ctypes.c_ubyte * 6)]
+
+
+@lru_cache(maxsize=1)
+def _is_elevated() -> bool:
+    """Check once per process whether the current token is in the Administrators group"""
+    try:
+        advapi32 = ctypes.windll.advapi32
+        authority = _SID_IDENTIFIER_AUTHORITY((ctypes.c_ubyte * 6)(*_SECURITY_NT_AUTHORITY))
+        admins_sid = ctypes.c_void_p()
+        if not advapi32.AllocateAndInitializeSid(
+            ctypes.byref(authority), 2, _SECURITY_BUILTIN_DOMAIN_RID, _DOMAIN_ALIAS_RID_ADMINS,
+            0, 0, 0, 0, 0, 0, ctypes.byref(admins_sid)
+        ):
+            return bool(ctypes.windll.shell32.IsUserAnAdmin())
+        try:
+            # A UAC-filtered token holds the group as deny-only, which does not count
+            is_member = wintypes.BOOL()
+            if not advapi32.CheckTokenMembership(None, admins_sid, ctypes.byref(is_member)):
+                return bool(ctypes.windll.shell32.IsUserAnAdmin())
+            return bool(is_member.value)
+        finally:
+            advapi32.FreeSid(admins_sid)
+    except Exception:
+        return False
+
+
+# NtQuerySystemInformation(SystemProcessInformation) snapshot of every process
+_SYSTEM_PROCESS_INFORMATION_CLASS = 5
+_STATUS_INFO_LENGTH_MISMATCH = -1073741820  # 0xC0000004 as a signed NTSTATUS
+_PROCESS_BUFFER_SIZE = 512 * 1024
+
+
+class _UNICODE_STRING(ctypes.Structure):
+    _fields_ = [
+        ('Length', wintypes.USHORT),
+        ('MaximumLength', wintypes.USHORT),
+        ('Buffer', ctypes.c_void_p),
+    ]
+
+
+class _SYSTEM_PROCESS_INFORMATION(ctypes.Structure):
+    # Leading fields only; each entry is followed by its thread records
+    _fields_ = [
+        ('NextEntryOffset', wintypes.ULONG),
+        ('NumberOfThreads', wintypes.ULONG),
+        ('WorkingSetPrivateSize', ctypes.c_longlong),
+        ('HardFaultCount', wintypes.ULONG),
+        ('NumberOfThreadsHighWatermark', wintypes.ULONG),
+        ('CycleTime', ctypes.c_ulonglong),
+        ('CreateTime', ctypes.c_longlong),
+        ('UserTime', ctypes.c_longlong),
+        ('KernelTime', ctypes.c_longlong),
+        ('ImageName', _UNICODE_STRING),
+        ('BasePriority', wintypes.LONG),
+        ('UniqueProcessId', ctypes.c_void_p),
+        ('InheritedFromUniqueProcessId', ctypes.c_void_p),
+        ('HandleCount', wintypes.ULONG),
+        ('SessionId', wintypes.ULONG),
+        ('UniqueProcessKey', ctypes.c_void_p),
+        ('PeakVirtualSize', ctypes.c_size_t),
+        ('VirtualSize', ctypes.c_size_t),
+        ('PageFaultCount', wintypes.ULONG),
+        ('PeakWorkingSetSize', ctypes.c_size_t),
+        ('WorkingSetSize', ctypes.c_size_t),
+    ]
+
+
 class EnhancedWindowsAdapter(BaseOSAdapter):
     """Enhanced Windows adapter with deep OS integration"""
     
@@ -31,30 +321,219 @@ class EnhancedWindowsAdapter(BaseOSAdapter):
         super().__init__()
         self.logger = get_logger("EnhancedWindowsAdapter")
         self.is_admin = self._check_admin_privileges()
+        # Service Control Manager connection and service handles, opened on first use
+        self._scm_handle = None
+        self._service_handles: Dict[tuple, Any] = {}
+        # Debounced WM_SETTINGCHANGE for single environment variable writes
+        self._env_broadcast_lock = threading.Lock()
+        self._env_broadcast_timer = None
+        # Persistent elevated helper (see admin_helper), started on the first admin call
+        self._admin_helper_lock = threading.Lock()
+        self._admin_pipe = None
+        self._admin_process = None
+        self._admin_helper_unavailable = False
+        # Registry keys whose values are cached until the key changes, by key path
+        self._watched_keys: Dict[str, _WatchedRegistryKey] = {}
+        # COM objects are bound to the thread that created them
+        self._task_scheduler = threading.local()
+        # Worker pool for the independent sections of get_system_performance
+        self._perf_executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix='perf')
+        # Prime the CPU counters so later non-blocking samples return a real delta
+        psutil.cpu_percent(interval=None)
+        # Logical CPU count is fixed for the process; frequency is re-read at most every _CPU_FREQ_TTL
+        self._cpu_count = psutil.cpu_count()
+        self._cpu_freq = psutil.cpu_freq()
+        self._cpu_freq_time = time.monotonic()
+        # Previous process snapshot: pid -> (create time, CPU time), and when it was taken
+        self._process_cpu_times: Dict[int, tuple] = {}
+        self._process_sample_time: Optional[float] = None
+        self._process_buffer_size = _PROCESS_BUFFER_SIZE
+        atexit.register(self.cleanup)
         
+    # Everyday operations use the standard Windows module adapters
+    def _create_filesystem_adapter(self):
+        from .windows_adapter import WindowsFilesystemAdapter
+        return WindowsFilesystemAdapter()
+    
+    def _create_process_adapter(self):
+        from .windows_adapter import WindowsProcessAdapter
+        return WindowsProcessAdapter()
+    
+    def _create_gui_adapter(self):
+        from .windows_adapter import WindowsGUIAdapter
+        return WindowsGUIAdapter()
+    
+    def _create_system_adapter(self):
+        from .windows_adapter import WindowsSystemAdapter
+        return WindowsSystemAdapter()
+    
+    def _create_network_adapter(self):
+        from .windows_adapter import WindowsNetworkAdapter
+        return WindowsNetworkAdapter()
+    
     def _check_admin_privileges(self) -> bool:
         """Check if running with administrator privileges"""
+        return _is_elevated()
+    
+    def _execute_command(self, command: Union[str, List[Any]]) -> Dict[str, Any]:
+        """Run a command (preferably an argv list) directly, without an intermediate shell"""
+        try:
+            if not isinstance(command, str):
+                command = [str(arg) for arg in command]
+            result = subprocess.run(command, shell=False, capture_output=True, text=True,
+                                    timeout=_COMMAND_TIMEOUT, creationflags=_CREATE_NO_WINDOW)
+            
+            return {
+                'success': result.returncode == 0,
+                'output': result.stdout,
+                'error': result.stderr,
+                'return_code': result.returncode
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f"Failed to run command: {e}",
+                'return_code': -1
+            }
+    
+    @staticmethod
+    def _shell_execute_elevated(program: str, parameters: str, directory: str = None) -> int:
+        """Start a program with the "runas" verb and return its process handle"""
+        sei = _SHELLEXECUTEINFOW()
+        sei.cbSize = ctypes.sizeof(sei)
+        sei.fMask = _SEE_MASK_NOCLOSEPROCESS | _SEE_MASK_NOASYNC
+        sei.lpVerb = 'runas'
+        sei.lpFile = program
+        sei.lpParameters = parameters
+        sei.lpDirectory = directory
+        sei.nShow = _SW_HIDE
+        if not ctypes.windll.shell32.ShellExecuteExW(ctypes.byref(sei)):
+            raise ctypes.WinError()
+        return sei.hProcess
+    
+    @staticmethod
+    def _current_user_sid() -> str:
+        """String SID of the user this process runs as"""
+        token = win32security.OpenProcessToken(win32api.GetCurrentProcess(), win32con.TOKEN_QUERY)
         try:
-            return ctypes.windll.shell32.IsUserAnAdmin()
-        except:
-            return False
+            return win32security.ConvertSidToStringSid(
+                win32security.GetTokenInformation(token, win32security.TokenUser)[0]
+            )
+        finally:
+            token.Close()
+    
+    def _start_admin_helper(self):
+        """Launch the elevated helper once and connect to its pipe"""
+        pipe_name = rf'\\.\pipe\omni_admin_{uuid.uuid4().hex}'
+        # The helper grants pipe access to this user only
+        parameters = subprocess.list2cmdline(
+            ['-m', 'omni_automator.os_adapters.admin_helper', pipe_name, str(os.getpid()),
+             self._current_user_sid()]
+        )
+        process = self._shell_execute_elevated(sys.executable, parameters, _PACKAGE_PARENT)
+        kernel32 = ctypes.windll.kernel32
+        
+        try:
+            deadline = time.monotonic() + _COMMAND_TIMEOUT
+            while True:
+                try:
+                    win32pipe.WaitNamedPipe(pipe_name, 100)
+                    pipe = win32file.CreateFile(pipe_name, win32file.GENERIC_READ | win32file.GENERIC_WRITE,
+                                                0, None, win32file.OPEN_EXISTING, 0, None)
+                    break
+                except pywintypes.error as e:
+                    # Anything but "not created yet" or "busy" (e.g. access denied) is final
+                    if e.winerror not in _PIPE_RETRY_ERRORS:
+                        raise
+                    # Give up if the helper died or is too slow
+                    if (time.monotonic() > deadline
+                            or kernel32.WaitForSingleObject(process, 0) != _WAIT_TIMEOUT):
+                        raise TimeoutError("Elevated helper did not start")
+                    time.sleep(0.05)
+            
+            # Make sure the pipe really belongs to the helper we started
+            if win32pipe.GetNamedPipeServerProcessId(pipe) != kernel32.GetProcessId(process):
+                win32file.CloseHandle(pipe)
+                raise PermissionError("Admin pipe is served by an unexpected process")
+            win32pipe.SetNamedPipeHandleState(pipe, win32pipe.PIPE_READMODE_MESSAGE, None, None)
+        except Exception:
+            kernel32.TerminateProcess(process, 1)
+            kernel32.CloseHandle(process)
+            raise
+        
+        self._admin_pipe = pipe
+        self._admin_process = process
     
-    def _run_as_admin(self, command: str) -> Dict[str, Any]:
+    def _stop_admin_helper(self):
+        """Disconnect from the helper; it exits once the pipe closes"""
+        if self._admin_pipe is not None:
+            try:
+                win32file.CloseHandle(self._admin_pipe)
+            except Exception:
+                pass
+            ctypes.windll.kernel32.CloseHandle(self._admin_process)
+            self._admin_pipe = self._admin_process = None
+    
+    def _run_via_admin_helper(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Send a request to the elevated helper, or return None if it is unavailable"""
+        with self._admin_helper_lock:
+            if self._admin_helper_unavailable:
+                return None
+            if self._admin_pipe is None:
+                try:
+                    self._start_admin_helper()
+                except Exception as e:
+                    # Declined, denied or timed out: don't prompt again for every call
+                    self._admin_helper_unavailable = True
+                    self.logger.debug("Elevated helper unavailable: %s", e)
+                    return None
+            try:
+                write_message(self._admin_pipe, request)
+                return json.loads(read_message(self._admin_pipe))
+            except Exception as e:
+                # The helper went away; the next call starts a new one
+                self._stop_admin_helper()
+                self.logger.debug("Elevated helper request failed: %s", e)
+                return None
+    
+    def _run_as_admin(self, command: Union[str, List[Any]]) -> Dict[str, Any]:
         """Run command with administrator privileges"""
         if self.is_admin:
             return self._execute_command(command)
         
+        if not isinstance(command, str):
+            command = [str(arg) for arg in command]
+        
+        # One elevation serves every admin call through the helper process
+        result = self._run_via_admin_helper({'command': command})
+        if result is not None:
+            return result
+        
         try:
-            # Use PowerShell to elevate
-            ps_command = f'Start-Process powershell -ArgumentList "-Command {command}" -Verb RunAs -Wait'
-            result = subprocess.run(['powershell', '-Command', ps_command], 
-                                  capture_output=True, text=True, timeout=30)
+            # Elevate with the "runas" verb directly: one process creation, and
+            # no PowerShell host starting another PowerShell. An argv list starts
+            # the program itself; a string (e.g. chained commands) goes through cmd.exe
+            if isinstance(command, str):
+                program, parameters = 'cmd.exe', f'/c {command}'
+            else:
+                program, parameters = command[0], subprocess.list2cmdline(command[1:])
+            process = self._shell_execute_elevated(program, parameters)
             
+            kernel32 = ctypes.windll.kernel32
+            try:
+                if kernel32.WaitForSingleObject(process, _COMMAND_TIMEOUT * 1000) == _WAIT_TIMEOUT:
+                    raise TimeoutError(f"Elevated command timed out after {_COMMAND_TIMEOUT} seconds")
+                exit_code = wintypes.DWORD()
+                kernel32.GetExitCodeProcess(process, ctypes.byref(exit_code))
+            finally:
+                kernel32.CloseHandle(process)
+            
+            # The elevated process runs in its own console, so its output cannot be captured
             return {
-                'success': result.returncode == 0,
-                'output': result.stdout,
-                'error': result.stderr,
-                'return_code': result.returncode
+                'success': exit_code.value == 0,
+                'output': '',
+                'error': '',
+                'return_code': exit_code.value
             }
         except Exception as e:
             return {
@@ -63,16 +542,80 @@ class EnhancedWindowsAdapter(BaseOSAdapter):
                 'return_code': -1
             }
     
+    def _run_as_admin_many(self, commands: List[List[Any]]) -> Dict[str, Any]:
+        """Run argv lists elevated, in order and without a shell, stopping at the first failure"""
+        commands = [[str(arg) for arg in command] for command in commands]
+        if self.is_admin:
+            return run_sequence(self._execute_command, commands)
+        
+        result = self._run_via_admin_helper({'commands': commands})
+        if result is not None:
+            return result
+        # No helper: elevate each command on its own
+        return run_sequence(self._run_as_admin, commands)
+    
+    def _get_service_handle(self, service_name: str, access: int):
+        """Get a cached service handle, connecting to the SCM on first use"""
+        key = (service_name.lower(), access)
+        handle = self._service_handles.get(key)
+        if handle is None:
+            if self._scm_handle is None:
+                self._scm_handle = win32service.OpenSCManager(None, None, win32service.SC_MANAGER_CONNECT)
+            handle = win32service.OpenService(self._scm_handle, service_name, access)
+            self._service_handles[key] = handle
+        return handle
+    
+    def _drop_service_handles(self, service_name: str):
+        """Close cached handles for a service, e.g. after it was deleted or reinstalled"""
+        name = service_name.lower()
+        for key in [key for key in self._service_handles if key[0] == name]:
+            try:
+                win32service.CloseServiceHandle(self._service_handles.pop(key))
+            except Exception:
+                pass
+    
+    def cleanup(self):
+        """Close cached service, SCM and registry handles and stop the worker pool and helper"""
+        self._perf_executor.shutdown(wait=False)
+        with self._env_broadcast_lock:
+            timer, self._env_broadcast_timer = self._env_broadcast_timer, None
+        if timer is not None:
+            # Flush a pending broadcast rather than drop it
+            timer.cancel()
+            self._broadcast_environment_change()
+        with self._admin_helper_lock:
+            self._stop_admin_helper()
+        for watched in self._watched_keys.values():
+            try:
+                watched.close()
+            except Exception:
+                pass
+        self._watched_keys.clear()
+        for handle in self._service_handles.values():
+            try:
+                win32service.CloseServiceHandle(handle)
+            except Exception:
+                pass
+        self._service_handles.clear()
+        if self._scm_handle is not None:
+            try:
+                win32service.CloseServiceHandle(self._scm_handle)
+            except Exception:
+                pass
+            self._scm_handle = None
+    
     # Enhanced System Operations
     def manage_system_service(self, service_name: str, action: str) -> Dict[str, Any]:
         """Manage Windows services (start, stop, restart, install, uninstall)"""
         try:
             if action == 'start':
-                win32serviceutil.StartService(service_name)
+                handle = self._get_service_handle(service_name, win32service.SERVICE_START)
+                win32service.StartService(handle, None)
                 return {'success': True, 'message': f'Service {service_name} started'}
             
             elif action == 'stop':
-                win32serviceutil.StopService(service_name)
+                handle = self._get_service_handle(service_name, win32service.SERVICE_STOP)
+                win32service.ControlService(handle, win32service.SERVICE_CONTROL_STOP)
                 return {'success': True, 'message': f'Service {service_name} stopped'}
             
             elif action == 'restart':
@@ -80,36 +623,46 @@ class EnhancedWindowsAdapter(BaseOSAdapter):
                 return {'success': True, 'message': f'Service {service_name} restarted'}
             
             elif action == 'status':
-                status = win32serviceutil.QueryServiceStatus(service_name)
+                handle = self._get_service_handle(service_name, win32service.SERVICE_QUERY_STATUS)
+                status = win32service.QueryServiceStatus(handle)
                 return {'success': True, 'status': status}
             
             else:
                 return {'success': False, 'error': f'Unknown action: {action}'}
                 
         except Exception as e:
+            self._drop_service_handles(service_name)
             return {'success': False, 'error': f'Service operation failed: {e}'}
     
+    def _parse_registry_path(self, key_path: str):
+        """Split a registry path into (root key handle or None, root key name, subkey path)"""
+        parts = key_path.split('\\', 1)
+        root_key_name = parts[0]
+        subkey_path = parts[1] if len(parts) > 1 else ""
+        return _ROOT_KEYS.get(root_key_name), root_key_name, subkey_path
+    
+    def _broadcast_environment_change(self):
+        """Tell top-level windows the environment changed, without waiting on hung ones"""
+        with self._env_broadcast_lock:
+            self._env_broadcast_timer = None
+        win32gui.SendMessageTimeout(win32con.HWND_BROADCAST, win32con.WM_SETTINGCHANGE, 0, 'Environment',
+                                    win32con.SMTO_ABORTIFHUNG | win32con.SMTO_NOTIMEOUTIFNOTHUNG, 50)
+    
+    def _schedule_environment_broadcast(self, delay: float = _ENV_BROADCAST_DELAY):
+        """Broadcast the environment change off the caller's thread, restarting the delay on each call"""
+        with self._env_broadcast_lock:
+            if self._env_broadcast_timer is not None:
+                self._env_broadcast_timer.cancel()
+            timer = threading.Timer(delay, self._broadcast_environment_change)
+            timer.daemon = True
+            self._env_broadcast_timer = timer
+            timer.start()
+    
     def manage_registry(self, operation: str, key_path: str, value_name: str = None, 
                        value_data: Any = None, value_type: int = winreg.REG_SZ) -> Dict[str, Any]:
         """Advanced registry operations"""
         try:
-            # Parse registry path
-            parts = key_path.split('\\', 1)
-            root_key_name = parts[0]
-            subkey_path = parts[1] if len(parts) > 1 else ""
-            
-            # Map root key names to constants
-            root_keys = {
-                'HKEY_CURRENT_USER': winreg.HKEY_CURRENT_USER,
-                'HKEY_LOCAL_MACHINE': winreg.HKEY_LOCAL_MACHINE,
-                'HKEY_CLASSES_ROOT': winreg.HKEY_CLASSES_ROOT,
-                'HKEY_USERS': winreg.HKEY_USERS,
-                'HKEY_CURRENT_CONFIG': winreg.HKEY_CURRENT_CONFIG,
-                'HKCU': winreg.HKEY_CURRENT_USER,
-                'HKLM': winreg.HKEY_LOCAL_MACHINE,
-            }
-            
-            root_key = root_keys.get(root_key_name)
+            root_key, root_key_name, subkey_path = self._parse_registry_path(key_path)
             if not root_key:
                 return {'success': False, 'error': f'Invalid root key: {root_key_name}'}
             
@@ -120,16 +673,7 @@ class EnhancedWindowsAdapter(BaseOSAdapter):
                         return {'success': True, 'value': value, 'type': reg_type}
                     else:
                         # List all values
-                        values = {}
-                        i = 0
-                        try:
-                            while True:
-                                name, value, reg_type = winreg.EnumValue(key, i)
-                                values[name] = {'value': value, 'type': reg_type}
-                                i += 1
-                        except WindowsError:
-                            pass
-                        return {'success': True, 'values': values}
+                        return {'success': True, 'values': _read_registry_values(key)}
             
             elif operation == 'write':
                 with winreg.CreateKey(root_key, subkey_path) as key:
@@ -148,31 +692,253 @@ class EnhancedWindowsAdapter(BaseOSAdapter):
         except Exception as e:
             return {'success': False, 'error': f'Registry operation failed: {e}'}
     
+    def _watched_values(self, key_path: str) -> Dict[str, Dict[str, Any]]:
+        """Get a key's values from the change-notified cache"""
+        watched = self._watched_keys.get(key_path)
+        if watched is None:
+            root_key, root_key_name, subkey_path = self._parse_registry_path(key_path)
+            if not root_key:
+                raise ValueError(f'Invalid root key: {root_key_name}')
+            watched = self._watched_keys.setdefault(key_path, _WatchedRegistryKey(root_key, subkey_path))
+        return watched.values()
+    
+    def manage_registry_batch(self, operation: str, key_path: str, values: List[Any]) -> Dict[str, Any]:
+        """Write or delete several values under one registry key, opening the key once"""
+        # 'write' takes (name, data) or (name, data, type) tuples, 'delete' takes value names
+        try:
+            root_key, root_key_name, subkey_path = self._parse_registry_path(key_path)
+            if not root_key:
+                return {'success': False, 'error': f'Invalid root key: {root_key_name}'}
+            
+            if operation == 'write':
+                with winreg.CreateKeyEx(root_key, subkey_path, 0, winreg.KEY_SET_VALUE) as key:
+                    for entry in values:
+                        name, data = entry[0], entry[1]
+                        value_type = entry[2] if len(entry) > 2 else winreg.REG_SZ
+                        winreg.SetValueEx(key, name, 0, value_type, data)
+                return {'success': True, 'message': f'Registry values set: {len(values)}'}
+            
+            elif operation == 'delete':
+                with winreg.OpenKey(root_key, subkey_path, 0, winreg.KEY_SET_VALUE) as key:
+                    for name in values:
+                        winreg.DeleteValue(key, name)
+                return {'success': True, 'message': f'Registry values deleted: {len(values)}'}
+            
+            else:
+                return {'success': False, 'error': f'Unknown batch registry operation: {operation}'}
+            
+        except Exception as e:
+            return {'success': False, 'error': f'Registry operation failed: {e}'}
+    
+    @staticmethod
+    def _registry_value_buffer(value_data: Any, value_type: int):
+        """Encode a value the way winreg.SetValueEx would, for RegSetValueExW"""
+        if value_type in (winreg.REG_SZ, winreg.REG_EXPAND_SZ):
+            return ctypes.create_unicode_buffer(str(value_data))
+        if value_type == winreg.REG_MULTI_SZ:
+            return ctypes.create_unicode_buffer(''.join(f'{item}\0' for item in value_data) + '\0')
+        if value_type == winreg.REG_DWORD:
+            return ctypes.c_uint32(value_data)
+        if value_type == winreg.REG_QWORD:
+            return ctypes.c_uint64(value_data)
+        data = bytes(value_data or b'')
+        return ctypes.create_string_buffer(data, len(data))
+    
+    def _write_registry_transacted(self, writes: List[tuple]):
+        """Apply (root key, subkey, name, data, type) writes in one KTM transaction"""
+        ktmw32 = ctypes.windll.ktmw32
+        advapi32 = ctypes.windll.advapi32
+        kernel32 = ctypes.windll.kernel32
+        ktmw32.CreateTransaction.restype = wintypes.HANDLE
+        advapi32.RegCreateKeyTransactedW.argtypes = [
+            wintypes.HKEY, wintypes.LPCWSTR, wintypes.DWORD, wintypes.LPWSTR, wintypes.DWORD,
+            wintypes.DWORD, ctypes.c_void_p, ctypes.POINTER(wintypes.HKEY), ctypes.POINTER(wintypes.DWORD),
+            wintypes.HANDLE, ctypes.c_void_p
+        ]
+        advapi32.RegSetValueExW.argtypes = [
+            wintypes.HKEY, wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD
+        ]
+        
+        transaction = ktmw32.CreateTransaction(None, None, 0, 0, 0, 0, 'OmniAutomator registry batch')
+        if not transaction or transaction == wintypes.HANDLE(-1).value:
+            raise ctypes.WinError()
+        keys = {}
+        try:
+            for root_key, subkey_path, name, data, value_type in writes:
+                key = keys.get((root_key, subkey_path))
+                if key is None:
+                    key = wintypes.HKEY()
+                    status = advapi32.RegCreateKeyTransactedW(
+                        root_key, subkey_path, 0, None, 0, winreg.KEY_WRITE, None,
+                        ctypes.byref(key), None, transaction, None
+                    )
+                    if status:
+                        raise ctypes.WinError(status)
+                    keys[(root_key, subkey_path)] = key
+                buffer = self._registry_value_buffer(data, value_type)
+                status = advapi32.RegSetValueExW(key, name, 0, value_type, ctypes.byref(buffer), ctypes.sizeof(buffer))
+                if status:
+                    raise ctypes.WinError(status)
+            if not ktmw32.CommitTransaction(transaction):
+                raise ctypes.WinError()
+        except Exception:
+            ktmw32.RollbackTransaction(transaction)
+            raise
+        finally:
+            for key in keys.values():
+                advapi32.RegCloseKey(key)
+            kernel32.CloseHandle(transaction)
+    
+    def manage_registry_many(self, writes: List[tuple]) -> Dict[str, Any]:
+        """Write values under several registry keys so that either all or none are applied"""
+        # Each write is (key_path, name, data) or (key_path, name, data, type)
+        try:
+            resolved = []
+            for entry in writes:
+                root_key, root_key_name, subkey_path = self._parse_registry_path(entry[0])
+                if not root_key:
+                    return {'success': False, 'error': f'Invalid root key: {root_key_name}'}
+                value_type = entry[3] if len(entry) > 3 else winreg.REG_SZ
+                resolved.append((root_key, subkey_path, entry[1], entry[2], value_type))
+            
+            try:
+                self._write_registry_transacted(resolved)
+                return {'success': True, 'transacted': True, 'message': f'Registry values set: {len(resolved)}'}
+            except (OSError, AttributeError) as e:
+                # Nano Server and some containers ship without KTM
+                if getattr(e, 'winerror', None) not in _KTM_UNAVAILABLE_ERRORS:
+                    raise
+                self.logger.debug("Transacted registry unavailable, writing directly: %s", e)
+            
+            for root_key, subkey_path, name, data, value_type in resolved:
+                with winreg.CreateKeyEx(root_key, subkey_path, 0, winreg.KEY_SET_VALUE) as key:
+                    winreg.SetValueEx(key, name, 0, value_type, data)
+            return {'success': True, 'transacted': False, 'message': f'Registry values set: {len(resolved)}'}
+            
+        except Exception as e:
+            return {'success': False, 'error': f'Registry operation failed: {e}'}
+    
+    def _get_task_service(self):
+        """Get this thread's connected Task Scheduler service object"""
+        service = getattr(self._task_scheduler, 'service', None)
+        if service is None:
+            pythoncom.CoInitialize()
+            service = win32com.client.Dispatch("Schedule.Service")
+            service.Connect()
+            self._task_scheduler.service = service
+        return service
+    
+    @staticmethod
+    def _split_command(command: str):
+        """Split a command line into (program, arguments)"""
+        command = command.strip()
+        if command.startswith('"'):
+            end = command.find('"', 1)
+            if end != -1:
+                return command[1:end], command[end + 1:].strip()
+        program, _, arguments = command.partition(' ')
+        return program, arguments.strip()
+    
+    def iter_scheduled_tasks(self) -> Iterator[Dict[str, Any]]:
+        """Yield tasks from every Task Scheduler folder, so callers can stop early"""
+        folders = [self._get_task_service().GetFolder('\\')]
+        while folders:
+            folder = folders.pop()
+            for task in folder.GetTasks(_TASK_ENUM_HIDDEN):
+                yield {
+                    'name': task.Name,
+                    'path': task.Path,
+                    'state': _TASK_STATES.get(task.State, 'unknown'),
+                    'enabled': bool(task.Enabled),
+                    'next_run': str(task.NextRunTime),
+                    'last_run': str(task.LastRunTime),
+                    'last_result': task.LastTaskResult
+                }
+            folders.extend(folder.GetFolders(0))
+    
+    @staticmethod
+    def _iter_schtasks_csv(output: str) -> Iterator[Dict[str, str]]:
+        """Yield task dicts from `schtasks /query /fo csv /nh` output"""
+        for row in csv.reader(io.StringIO(output)):
+            if row:
+                yield dict(zip(_SCHTASKS_CSV_FIELDS, row))
+    
+    def _register_scheduled_task(self, task_name: str, command: str, schedule: str, time_str: str):
+        """Create or replace a task through the Task Scheduler COM API"""
+        service = self._get_task_service()
+        definition = service.NewTask(0)
+        definition.RegistrationInfo.Description = f'Created by OmniAutomator: {command}'
+        
+        trigger = definition.Triggers.Create(_TASK_TRIGGER_TYPES[schedule])
+        for name, value in _task_trigger_fields(schedule, time_str, date.today()).items():
+            setattr(trigger, name, value)
+        
+        action = definition.Actions.Create(_TASK_ACTION_EXEC)
+        action.Path, action.Arguments = self._split_command(command)
+        
+        service.GetFolder('\\').RegisterTaskDefinition(
+            task_name, definition, _TASK_CREATE_OR_UPDATE, None, None, _TASK_LOGON_INTERACTIVE_TOKEN
+        )
+    
     def manage_scheduled_tasks(self, operation: str, task_name: str, **kwargs) -> Dict[str, Any]:
         """Manage Windows scheduled tasks"""
+        try:
+            if operation == 'create':
+                command = kwargs.get('command', '')
+                schedule = str(kwargs.get('schedule', 'DAILY')).upper()
+                time_str = kwargs.get('time', '09:00')
+                
+                # Schedules without a direct trigger mapping (MINUTE, HOURLY, ONIDLE) use schtasks
+                if schedule not in _TASK_TRIGGER_TYPES:
+                    return self._manage_scheduled_tasks_schtasks(operation, task_name, **kwargs)
+                self._register_scheduled_task(task_name, command, schedule, time_str)
+                return {'success': True, 'message': f'Scheduled task created: {task_name}'}
+            
+            elif operation == 'delete':
+                self._get_task_service().GetFolder('\\').DeleteTask(task_name, 0)
+                return {'success': True, 'message': f'Scheduled task deleted: {task_name}'}
+            
+            elif operation == 'run':
+                self._get_task_service().GetFolder('\\').GetTask(task_name).Run(None)
+                return {'success': True, 'message': f'Scheduled task started: {task_name}'}
+            
+            elif operation == 'list':
+                return {'success': True, 'tasks': list(self.iter_scheduled_tasks())}
+            
+        except Exception as e:
+            # Only an access-denied registration needs an elevated schtasks call
+            hresult = getattr(e, 'hresult', e.args[0] if e.args else None)
+            if hresult == _E_ACCESSDENIED:
+                return self._manage_scheduled_tasks_schtasks(operation, task_name, **kwargs)
+            return {'success': False, 'error': f'Task scheduler operation failed: {e}'}
+    
+    def _manage_scheduled_tasks_schtasks(self, operation: str, task_name: str, **kwargs) -> Dict[str, Any]:
+        """Manage scheduled tasks through schtasks.exe"""
         try:
             if operation == 'create':
                 command = kwargs.get('command', '')
                 schedule = kwargs.get('schedule', 'DAILY')
                 time_str = kwargs.get('time', '09:00')
                 
-                cmd = f'schtasks /create /tn "{task_name}" /tr "{command}" /sc {schedule} /st {time_str} /f'
+                cmd = ['schtasks', '/create', '/tn', task_name, '/tr', command, '/sc', schedule, '/st', time_str, '/f']
                 result = self._run_as_admin(cmd)
                 return result
             
             elif operation == 'delete':
-                cmd = f'schtasks /delete /tn "{task_name}" /f'
+                cmd = ['schtasks', '/delete', '/tn', task_name, '/f']
                 result = self._run_as_admin(cmd)
                 return result
             
             elif operation == 'run':
-                cmd = f'schtasks /run /tn "{task_name}"'
+                cmd = ['schtasks', '/run', '/tn', task_name]
                 result = self._run_as_admin(cmd)
                 return result
             
             elif operation == 'list':
-                cmd = 'schtasks /query /fo csv'
+                cmd = ['schtasks', '/query', '/fo', 'csv', '/nh']
                 result = self._execute_command(cmd)
+                if result.get('success'):
+                    result['tasks'] = list(self._iter_schtasks_csv(result['output']))
                 return result
             
         except Exception as e:
@@ -189,31 +955,52 @@ class EnhancedWindowsAdapter(BaseOSAdapter):
                 direction = kwargs.get('direction', 'in')
                 action = kwargs.get('action', 'allow')
                 
+                cmd = ['netsh', 'advfirewall', 'firewall', 'add', 'rule',
+                       f'name={rule_name}', f'dir={direction}', f'action={action}']
                 if program:
-                    cmd = f'netsh advfirewall firewall add rule name="{rule_name}" dir={direction} action={action} program="{program}"'
+                    cmd.append(f'program={program}')
                 elif port:
-                    cmd = f'netsh advfirewall firewall add rule name="{rule_name}" dir={direction} action={action} protocol={protocol} localport={port}'
+                    cmd += [f'protocol={protocol}', f'localport={port}']
                 else:
                     return {'success': False, 'error': 'Must specify either program or port'}
                 
                 return self._run_as_admin(cmd)
             
+            elif operation == 'add_rules':
+                return self.manage_firewall_bulk(kwargs.get('rules', []))
+            
             elif operation == 'delete_rule':
                 rule_name = kwargs.get('rule_name')
-                cmd = f'netsh advfirewall firewall delete rule name="{rule_name}"'
+                cmd = ['netsh', 'advfirewall', 'firewall', 'delete', 'rule', f'name={rule_name}']
                 return self._run_as_admin(cmd)
             
             elif operation == 'enable':
-                cmd = 'netsh advfirewall set allprofiles state on'
+                cmd = ['netsh', 'advfirewall', 'set', 'allprofiles', 'state', 'on']
                 return self._run_as_admin(cmd)
             
             elif operation == 'disable':
-                cmd = 'netsh advfirewall set allprofiles state off'
+                cmd = ['netsh', 'advfirewall', 'set', 'allprofiles', 'state', 'off']
                 return self._run_as_admin(cmd)
             
         except Exception as e:
             return {'success': False, 'error': f'Firewall operation failed: {e}'}
     
+    def manage_firewall_bulk(self, rules: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Add many firewall rules, merging compatible ones, in a single elevated call"""
+        try:
+            try:
+                commands = _firewall_rule_commands(rules)
+            except ValueError as e:
+                return {'success': False, 'error': str(e)}
+            
+            # One elevation for the whole set; stop at the first failing rule
+            result = self._run_as_admin_many(commands)
+            result['rule_count'] = len(commands)
+            return result
+            
+        except Exception as e:
+            return {'success': False, 'error': f'Firewall operation failed: {e}'}
+    
     def manage_user_accounts(self, operation: str, username: str, **kwargs) -> Dict[str, Any]:
         """Manage Windows user accounts"""
         try:
@@ -221,31 +1008,31 @@ class EnhancedWindowsAdapter(BaseOSAdapter):
                 password = kwargs.get('password', 'TempPass123!')
                 fullname = kwargs.get('fullname', username)
                 
-                cmd = f'net user {username} {password} /add /fullname:"{fullname}"'
+                cmd = ['net', 'user', username, password, '/add', f'/fullname:{fullname}']
                 result = self._run_as_admin(cmd)
                 
                 # Add to users group
                 if result.get('success'):
-                    group_cmd = f'net localgroup Users {username} /add'
+                    group_cmd = ['net', 'localgroup', 'Users', username, '/add']
                     self._run_as_admin(group_cmd)
                 
                 return result
             
             elif operation == 'delete':
-                cmd = f'net user {username} /delete'
+                cmd = ['net', 'user', username, '/delete']
                 return self._run_as_admin(cmd)
             
             elif operation == 'enable':
-                cmd = f'net user {username} /active:yes'
+                cmd = ['net', 'user', username, '/active:yes']
                 return self._run_as_admin(cmd)
             
             elif operation == 'disable':
-                cmd = f'net user {username} /active:no'
+                cmd = ['net', 'user', username, '/active:no']
                 return self._run_as_admin(cmd)
             
             elif operation == 'change_password':
                 new_password = kwargs.get('new_password')
-                cmd = f'net user {username} {new_password}'
+                cmd = ['net', 'user', username, new_password]
                 return self._run_as_admin(cmd)
             
         except Exception as e:
@@ -260,7 +1047,9 @@ class EnhancedWindowsAdapter(BaseOSAdapter):
                 subnet_mask = kwargs.get('subnet_mask', '255.255.255.0')
                 gateway = kwargs.get('gateway')
                 
-                cmd = f'netsh interface ip set address "{interface}" static {ip_address} {subnet_mask} {gateway}'
+                cmd = ['netsh', 'interface', 'ip', 'set', 'address', interface, 'static', ip_address, subnet_mask]
+                if gateway:
+                    cmd.append(gateway)
                 return self._run_as_admin(cmd)
             
             elif operation == 'set_dns':
@@ -268,62 +1057,146 @@ class EnhancedWindowsAdapter(BaseOSAdapter):
                 primary_dns = kwargs.get('primary_dns')
                 secondary_dns = kwargs.get('secondary_dns')
                 
-                cmd = f'netsh interface ip set dns "{interface}" static {primary_dns}'
+                cmd = ['netsh', 'interface', 'ip', 'set', 'dns', interface, 'static', primary_dns]
                 result = self._run_as_admin(cmd)
                 
                 if secondary_dns and result.get('success'):
-                    cmd2 = f'netsh interface ip add dns "{interface}" {secondary_dns} index=2'
+                    cmd2 = ['netsh', 'interface', 'ip', 'add', 'dns', interface, secondary_dns, 'index=2']
                     self._run_as_admin(cmd2)
                 
                 return result
             
             elif operation == 'enable_dhcp':
                 interface = kwargs.get('interface', 'Ethernet')
-                cmd = f'netsh interface ip set address "{interface}" dhcp'
+                cmd = ['netsh', 'interface', 'ip', 'set', 'address', interface, 'dhcp']
                 return self._run_as_admin(cmd)
             
         except Exception as e:
             return {'success': False, 'error': f'Network operation failed: {e}'}
     
+    @staticmethod
+    def _collect_disk_usage() -> Dict[str, Any]:
+        """Get usage for every fixed partition"""
+        kernel32 = ctypes.windll.kernel32
+        free_caller, total, free = ctypes.c_ulonglong(), ctypes.c_ulonglong(), ctypes.c_ulonglong()
+        disk_usage = {}
+        # all=False already leaves out CD-ROM drives; removable media is skipped too,
+        # so no empty card reader gets probed
+        for partition in psutil.disk_partitions(all=False):
+            if 'removable' in partition.opts or kernel32.GetDriveTypeW(partition.mountpoint) != _DRIVE_FIXED:
+                continue
+            if not kernel32.GetDiskFreeSpaceExW(partition.mountpoint, ctypes.byref(free_caller),
+                                                ctypes.byref(total), ctypes.byref(free)):
+                continue  # e.g. a locked volume
+            used = total.value - free.value
+            disk_usage[partition.device] = {
+                'total': total.value,
+                'used': used,
+                'free': free_caller.value,
+                'percent': (used / total.value) * 100 if total.value else 0.0
+            }
+        return disk_usage
+    
+    def _query_process_information(self):
+        """Fetch the SystemProcessInformation buffer, growing it until everything fits"""
+        ntdll = ctypes.windll.ntdll
+        needed = wintypes.ULONG()
+        while True:
+            buffer = ctypes.create_string_buffer(self._process_buffer_size)
+            status = ntdll.NtQuerySystemInformation(
+                _SYSTEM_PROCESS_INFORMATION_CLASS, buffer, self._process_buffer_size, ctypes.byref(needed)
+            )
+            if status != _STATUS_INFO_LENGTH_MISMATCH:
+                break
+            # Processes can start between calls, so leave some headroom
+            self._process_buffer_size = max(needed.value, self._process_buffer_size) + 64 * 1024
+        if status != 0:
+            raise OSError(f"NtQuerySystemInformation failed with status {status & 0xFFFFFFFF:#010x}")
+        return buffer
+    
+    def _snapshot_processes(self) -> List[Dict[str, Any]]:
+        """Get pid/name/CPU/memory for every process from one kernel snapshot"""
+        buffer = self._query_process_information()
+        now = time.monotonic()
+        total_memory = psutil.virtual_memory().total
+        
+        # CPU times are in 100 ns units; percent is relative to one CPU, as in psutil
+        previous = self._process_cpu_times
+        elapsed = (now - self._process_sample_time) * 10_000_000 if self._process_sample_time else 0
+        
+        cpu_times = {}
+        processes = []
+        offset = 0
+        while True:
+            entry = _SYSTEM_PROCESS_INFORMATION.from_buffer(buffer, offset)
+            pid = entry.UniqueProcessId or 0
+            image = entry.ImageName
+            name = ctypes.wstring_at(image.Buffer, image.Length // 2) if image.Buffer else 'System Idle Process'
+            
+            cpu_time = entry.UserTime + entry.KernelTime
+            cpu_times[pid] = (entry.CreateTime, cpu_time)
+            prior = previous.get(pid)
+            if elapsed and prior is not None and prior[0] == entry.CreateTime:
+                cpu_percent = (cpu_time - prior[1]) / elapsed * 100
+            else:
+                cpu_percent = 0.0
+            
+            processes.append({
+                'pid': pid,
+                'name': name,
+                'cpu_percent': round(cpu_percent, 1),
+                'memory_percent': entry.WorkingSetSize / total_memory * 100
+            })
+            
+            if not entry.NextEntryOffset:
+                break
+            offset += entry.NextEntryOffset
+        
+        self._process_cpu_times = cpu_times
+        self._process_sample_time = now
+        return processes
+    
+    def _collect_top_processes(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get the processes using the most CPU"""
+        try:
+            processes = self._snapshot_processes()
+        except Exception as e:
+            # Formatted only if debug logging is enabled
+            self.logger.debug("Process snapshot failed, using psutil: %s", e)
+            processes = (proc.info for proc in psutil.process_iter(
+                ['pid', 'name', 'cpu_percent', 'memory_percent'], ad_value=None))
+        # Partial selection instead of sorting every process
+        return heapq.nlargest(limit, processes, key=lambda x: x.get('cpu_percent') or 0)
+    
+    def _get_cpu_freq(self):
+        """Get psutil.cpu_freq(), re-read only once the cached value is _CPU_FREQ_TTL old"""
+        now = time.monotonic()
+        if now - self._cpu_freq_time >= _CPU_FREQ_TTL:
+            self._cpu_freq = psutil.cpu_freq()
+            self._cpu_freq_time = now
+        return self._cpu_freq
+    
     def get_system_performance(self) -> Dict[str, Any]:
         """Get detailed system performance metrics"""
         try:
-            # CPU information
-            cpu_percent = psutil.cpu_percent(interval=1)
-            cpu_count = psutil.cpu_count()
-            cpu_freq = psutil.cpu_freq()
+            # Disk and process scans are independent, so run them alongside the rest
+            disk_future = self._perf_executor.submit(self._collect_disk_usage)
+            processes_future = self._perf_executor.submit(self._collect_top_processes)
+            
+            # CPU information; non-blocking sample since the previous call
+            cpu_percent = psutil.cpu_percent(interval=None)
+            cpu_count = self._cpu_count
+            cpu_freq = self._get_cpu_freq()
             
             # Memory information
             memory = psutil.virtual_memory()
             swap = psutil.swap_memory()
             
-            # Disk information
-            disk_usage = {}
-            for partition in psutil.disk_partitions():
-                try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    disk_usage[partition.device] = {
-                        'total': usage.total,
-                        'used': usage.used,
-                        'free': usage.free,
-                        'percent': (usage.used / usage.total) * 100
-                    }
-                except:
-                    continue
-            
             # Network information
             network_io = psutil.net_io_counters()
             
-            # Process information
-            processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
-                try:
-                    processes.append(proc.info)
-                except:
-                    continue
-            
-            # Sort by CPU usage
-            processes.sort(key=lambda x: x.get('cpu_percent', 0), reverse=True)
+            disk_usage = disk_future.result()
+            processes = processes_future.result()
             
             return {
                 'success': True,
@@ -351,7 +1224,7 @@ class EnhancedWindowsAdapter(BaseOSAdapter):
                     'packets_sent': network_io.packets_sent,
                     'packets_recv': network_io.packets_recv
                 },
-                'top_processes': processes[:10]
+                'top_processes': processes
             }
             
         except Exception as e:
@@ -362,14 +1235,20 @@ class EnhancedWindowsAdapter(BaseOSAdapter):
         try:
             startup_key = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Run"
             
+            # A list of (name, path) pairs / names is applied with one key open
             if operation == 'add':
+                if isinstance(program_name, list):
+                    return self.manage_registry_batch('write', f'HKLM\\{startup_key}', program_name)
                 return self.manage_registry('write', f'HKLM\\{startup_key}', program_name, program_path)
             
             elif operation == 'remove':
+                if isinstance(program_name, list):
+                    return self.manage_registry_batch('delete', f'HKLM\\{startup_key}', program_name)
                 return self.manage_registry('delete', f'HKLM\\{startup_key}', program_name)
             
             elif operation == 'list':
-                return self.manage_registry('read', f'HKLM\\{startup_key}')
+                # Served from cache until the Run key changes
+                return {'success': True, 'values': dict(self._watched_values(f'HKLM\\{startup_key}'))}
             
         except Exception as e:
             return {'success': False, 'error': f'Startup management failed: {e}'}
@@ -382,20 +1261,42 @@ class EnhancedWindowsAdapter(BaseOSAdapter):
             else:
                 reg_path = r"HKCU\Environment"
             
+            # A list of (name, value) pairs / names is applied with one key open
+            # and a single broadcast; single calls share a debounced broadcast
             if operation == 'set':
-                result = self.manage_registry('write', reg_path, var_name, var_value)
-                if result.get('success'):
-                    # Broadcast change
-                    win32gui.SendMessage(win32con.HWND_BROADCAST, win32con.WM_SETTINGCHANGE, 0, 'Environment')
+                if isinstance(var_name, list):
+                    result = self.manage_registry_batch('write', reg_path, var_name)
+                    if result.get('success'):
+                        self._schedule_environment_broadcast(0)
+                else:
+                    result = self.manage_registry('write', reg_path, var_name, var_value)
+                    if result.get('success'):
+                        self._schedule_environment_broadcast()
                 return result
             
             elif operation == 'get':
-                return self.manage_registry('read', reg_path, var_name)
+                # Served from cache until the Environment key changes
+                values = self._watched_values(reg_path)
+                if not var_name:
+                    return {'success': True, 'values': dict(values)}
+                entry = values.get(var_name)
+                if entry is None:
+                    # Registry value names are case-insensitive
+                    folded = var_name.lower()
+                    entry = next((v for name, v in values.items() if name.lower() == folded), None)
+                if entry is None:
+                    return {'success': False, 'error': f'Environment variable not found: {var_name}'}
+                return {'success': True, 'value': entry['value'], 'type': entry['type']}
             
             elif operation == 'delete':
-                result = self.manage_registry('delete', reg_path, var_name)
-                if result.get('success'):
-                    win32gui.SendMessage(win32con.HWND_BROADCAST, win32con.WM_SETTINGCHANGE, 0, 'Environment')
+                if isinstance(var_name, list):
+                    result = self.manage_registry_batch('delete', reg_path, var_name)
+                    if result.get('success'):
+                        self._schedule_environment_broadcast(0)
+                else:
+                    result = self.manage_registry('delete', reg_path, var_name)
+                    if result.get('success'):
+                        self._schedule_environment_broadcast()
                 return result
             
         except Exception as e:
@@ -404,53 +1305,57 @@ class EnhancedWindowsAdapter(BaseOSAdapter):
     def create_system_restore_point(self, description: str = "OmniAutomator Restore Point") -> Dict[str, Any]:
         """Create a system restore point"""
         try:
-            cmd = f'powershell "Checkpoint-Computer -Description \\"{description}\\" -RestorePointType MODIFY_SETTINGS"'
+            # Single-quoted PowerShell string; embedded quotes are doubled
+            quoted = description.replace("'", "''")
+            cmd = ['powershell', '-NoProfile', '-NonInteractive', '-Command',
+                   f"Checkpoint-Computer -Description '{quoted}' -RestorePointType MODIFY_SETTINGS"]
             return self._run_as_admin(cmd)
         except Exception as e:
             return {'success': False, 'error': f'System restore point creation failed: {e}'}
     
+    @staticmethod
+    def _query_registry_value(key, name: str, default: Any = None) -> Any:
+        """Read a registry value, returning default when it is missing"""
+        try:
+            return winreg.QueryValueEx(key, name)[0]
+        except OSError:
+            return default
+    
     def get_installed_software(self) -> Dict[str, Any]:
         """Get list of installed software"""
         try:
             software_list = []
             
-            # Check both 32-bit and 64-bit registry locations
-            registry_paths = [
-                r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall",
-                r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall"
-            ]
+            uninstall_path = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"
             
-            for reg_path in registry_paths:
+            # Check both the 64-bit and 32-bit registry views of the same key
+            for view in _SOFTWARE_VIEWS:
                 try:
-                    with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, reg_path) as key:
-                        i = 0
-                        while True:
+                    with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, uninstall_path, 0, winreg.KEY_READ | view) as key:
+                        # The subkey count bounds the loop instead of waiting for the end-of-list error
+                        for i in range(winreg.QueryInfoKey(key)[0]):
                             try:
                                 subkey_name = winreg.EnumKey(key, i)
-                                with winreg.OpenKey(key, subkey_name) as subkey:
-                                    try:
-                                        display_name = winreg.QueryValueEx(subkey, "DisplayName")[0]
-                                        try:
-                                            display_version = winreg.QueryValueEx(subkey, "DisplayVersion")[0]
-                                        except:
-                                            display_version = "Unknown"
-                                        
-                                        try:
-                                            publisher = winreg.QueryValueEx(subkey, "Publisher")[0]
-                                        except:
-                                            publisher = "Unknown"
-                                        
-                                        software_list.append({
-                                            'name': display_name,
-                                            'version': display_version,
-                                            'publisher': publisher
-                                        })
-                                    except:
-                                        pass
-                                i += 1
-                            except WindowsError:
-                                break
-                except:
+                            except OSError as e:
+                                if e.winerror != _ERROR_NO_MORE_ITEMS:
+                                    raise
+                                break  # Entries were removed while enumerating
+                            
+                            try:
+                                with winreg.OpenKey(key, subkey_name, 0, winreg.KEY_READ | view) as subkey:
+                                    # Most entries (updates, components) have no DisplayName;
+                                    # skip them before reading anything else
+                                    display_name = self._query_registry_value(subkey, "DisplayName")
+                                    if display_name is None:
+                                        continue
+                                    software_list.append({
+                                        'name': display_name,
+                                        'version': self._query_registry_value(subkey, "DisplayVersion", "Unknown"),
+                                        'publisher': self._query_registry_value(subkey, "Publisher", "Unknown")
+                                    })
+                            except OSError:
+                                continue
+                except OSError:
                     continue
             
             return {'success': True, 'software': software_list}
@@ -458,46 +1363,51 @@ class EnhancedWindowsAdapter(BaseOSAdapter):
         except Exception as e:
             return {'success': False, 'error': f'Software enumeration failed: {e}'}
     
+    # Operation name -> handler(adapter, params), built once for every call
+    _OPERATIONS = {
+        'manage_service': lambda self, params: self.manage_system_service(
+            params.get('service_name'), params.get('action')
+        ),
+        'manage_registry': lambda self, params: self.manage_registry(
+            params.get('operation'), params.get('key_path'),
+            params.get('value_name'), params.get('value_data'),
+            params.get('value_type', winreg.REG_SZ)
+        ),
+        'manage_registry_batch': lambda self, params: self.manage_registry_batch(
+            params.get('operation'), params.get('key_path'), params.get('values', [])
+        ),
+        'manage_registry_many': lambda self, params: self.manage_registry_many(params.get('writes', [])),
+        'manage_scheduled_task': lambda self, params: self.manage_scheduled_tasks(
+            params.get('operation'), params.get('task_name'), **params
+        ),
+        'manage_firewall': lambda self, params: self.manage_firewall(
+            params.get('operation'), **params
+        ),
+        'manage_user': lambda self, params: self.manage_user_accounts(
+            params.get('operation'), params.get('username'), **params
+        ),
+        'manage_network': lambda self, params: self.manage_network_settings(
+            params.get('operation'), **params
+        ),
+        'get_performance': lambda self, params: self.get_system_performance(),
+        'manage_startup': lambda self, params: self.manage_system_startup(
+            params.get('operation'), params.get('program_name'),
+            params.get('program_path')
+        ),
+        'manage_environment': lambda self, params: self.manage_environment_variables(
+            params.get('operation'), params.get('var_name'),
+            params.get('var_value'), params.get('scope', 'user')
+        ),
+        'create_restore_point': lambda self, params: self.create_system_restore_point(
+            params.get('description', 'OmniAutomator Restore Point')
+        ),
+        'get_installed_software': lambda self, params: self.get_installed_software()
+    }
+    
     def execute_advanced_operation(self, operation: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute advanced OS-level operations"""
-        
-        operation_map = {
-            'manage_service': lambda: self.manage_system_service(
-                params.get('service_name'), params.get('action')
-            ),
-            'manage_registry': lambda: self.manage_registry(
-                params.get('operation'), params.get('key_path'),
-                params.get('value_name'), params.get('value_data'),
-                params.get('value_type', winreg.REG_SZ)
-            ),
-            'manage_scheduled_task': lambda: self.manage_scheduled_tasks(
-                params.get('operation'), params.get('task_name'), **params
-            ),
-            'manage_firewall': lambda: self.manage_firewall(
-                params.get('operation'), **params
-            ),
-            'manage_user': lambda: self.manage_user_accounts(
-                params.get('operation'), params.get('username'), **params
-            ),
-            'manage_network': lambda: self.manage_network_settings(
-                params.get('operation'), **params
-            ),
-            'get_performance': lambda: self.get_system_performance(),
-            'manage_startup': lambda: self.manage_system_startup(
-                params.get('operation'), params.get('program_name'),
-                params.get('program_path')
-            ),
-            'manage_environment': lambda: self.manage_environment_variables(
-                params.get('operation'), params.get('var_name'),
-                params.get('var_value'), params.get('scope', 'user')
-            ),
-            'create_restore_point': lambda: self.create_system_restore_point(
-                params.get('description', 'OmniAutomator Restore Point')
-            ),
-            'get_installed_software': lambda: self.get_installed_software()
-        }
-        
-        if operation in operation_map:
-            return operation_map[operation]()
+        handler = self._OPERATIONS.get(operation)
+        if handler is not None:
+            return handler(self, params)
         else:
             return {'success': False, 'error': f'Unknown advanced operation: {operation}'}
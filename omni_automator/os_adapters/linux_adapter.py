@@ -3,13 +3,17 @@ Linux-specific OS adapter implementation
 """
 
 import os
+import pwd
+import re
+import shlex
 import shutil
+import signal
+from stat import S_ISREG
 import subprocess
 import time
-import psutil
-import pyautogui
-import requests
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
 from .base_adapter import (
@@ -17,33 +21,121 @@ from .base_adapter import (
     BaseGUIAdapter, BaseSystemAdapter, BaseNetworkAdapter
 )
 
-# Linux-specific imports
-try:
-    import Xlib.display
-    import Xlib.X
-    HAS_XLIB = True
-except ImportError:
-    HAS_XLIB = False
+# psutil, pyautogui and requests are imported where they are used, so a session
+# that only touches the filesystem never loads them (pyautogui pulls in PIL and Xlib)
+
+_CLK_TCK = os.sysconf('SC_CLK_TCK')
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+# Kernel truncates comm to this many characters; longer names come from cmdline
+_COMM_MAX_LEN = 15
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# KEY=value lines of os-release(5); the value may be wrapped in quotes
+_OS_RELEASE_LINE = re.compile(r'^([A-Za-z0-9_]+)=["\']?(.*?)["\']?[ \t]*$', re.M)
+_COPY_CHUNK_SIZE = 1024 * 1024 * 1024
+# On these filesystems each unlink is a server round trip, so trees are deleted in parallel
+_NETWORK_FILESYSTEMS = frozenset(('nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', 'ceph', 'glusterfs',
+                                  'fuse.sshfs', 'lustre', '9p'))
+_DELETE_WORKERS = 8
+_DISK_USAGE_TTL = 1.0  # Seconds
+_MOUNTINFO_ESCAPE = re.compile(r'\\([0-7]{3})')
+
+
+@lru_cache(maxsize=1024)
+def _uid_to_name(uid: int) -> str:
+    """Resolve a uid to a user name; NSS lookups can be slow, and few uids own most processes"""
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)  # Same fallback as psutil
+
+
+def _fast_copy(src: str, dst: str) -> str:
+    """shutil.copy2 using copy_file_range, so the kernel copies (or reflinks) the data"""
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    src_stat = os.stat(src)
+    if not S_ISREG(src_stat.st_mode) or not hasattr(os, 'copy_file_range'):
+        return shutil.copy2(src, dst)
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            copied = 0
+            while True:
+                count = os.copy_file_range(fsrc.fileno(), fdst.fileno(), _COPY_CHUNK_SIZE)
+                if not count:
+                    break
+                copied += count
+    except OSError:
+        # e.g. EXDEV on older kernels, or a filesystem without copy_file_range support
+        return shutil.copy2(src, dst)
+    if not copied:
+        # Some kernels report EOF at once for procfs/sysfs, FUSE or network files that
+        # have content (procfs sizes read 0), so only trust an empty copy from a plain read
+        return shutil.copy2(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
+@lru_cache(maxsize=32)
+def _load_template(image_path: str, mtime_ns: int):
+    """Decode a grayscale template image with OpenCV, once per file version"""
+    import cv2  # Optional; ImportError means pyautogui's default matcher is used
+    
+    template = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+    if template is None:
+        raise ValueError(f"Cannot read image: {image_path}")
+    return template
+
+
+def _filesystem_type(path: str) -> Optional[str]:
+    """Get the type of the filesystem holding path, from /proc/self/mountinfo"""
+    path = os.path.realpath(path)
+    best, fstype = '', None
+    try:
+        with open('/proc/self/mountinfo', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                fields, _, rest = line.partition(' - ')
+                # Mount points escape spaces etc. as octal, e.g. \040
+                mount_point = _MOUNTINFO_ESCAPE.sub(lambda m: chr(int(m.group(1), 8)), fields.split()[4])
+                if ((path == mount_point or path.startswith(mount_point.rstrip('/') + '/'))
+                        and len(mount_point) >= len(best)):
+                    best, fstype = mount_point, rest.split()[0]
+    except OSError:
+        return None
+    return fstype
+
+
+def _parallel_rmtree(path: str):
+    """Delete a tree with one rmtree per top-level subdirectory, on worker threads"""
+    # Unlinks in one directory serialize on its inode lock, so the work is split by subtree
+    with os.scandir(path) as entries:
+        entries = list(entries)
+    with ThreadPoolExecutor(max_workers=_DELETE_WORKERS) as pool:
+        futures = [pool.submit(shutil.rmtree, entry.path)
+                   for entry in entries if entry.is_dir(follow_symlinks=False)]
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                os.unlink(entry.path)
+        for future in futures:
+            future.result()
+    os.rmdir(path)
 
 
 class LinuxFilesystemAdapter(BaseFilesystemAdapter):
     """Linux filesystem operations - inherits most from Windows but with Linux-specific paths"""
     
-    def execute(self, action: str, params: Dict[str, Any]) -> Any:
-        if action == 'create_folder':
-            return self.create_folder(params.get('name'), params.get('location'))
-        elif action == 'create_file':
-            return self.create_file(params.get('name'), params.get('location'))
-        elif action == 'delete':
-            return self.delete(params.get('path'))
-        elif action == 'copy':
-            return self.copy(params.get('source'), params.get('destination'))
-        elif action == 'move':
-            return self.move(params.get('source'), params.get('destination'))
-        elif action == 'list':
-            return self.list_directory(params.get('path', '.'))
-        else:
-            raise ValueError(f"Unknown filesystem action: {action}")
+    __slots__ = ()
+    
+    _ACTIONS = {
+        'create_folder': lambda self, params: self.create_folder(params.get('name'), params.get('location')),
+        'create_file': lambda self, params: self.create_file(params.get('name'), params.get('location')),
+        'delete': lambda self, params: self.delete(params.get('path')),
+        'copy': lambda self, params: self.copy(params.get('source'), params.get('destination')),
+        'move': lambda self, params: self.move(params.get('source'), params.get('destination')),
+        'list': lambda self, params: self.list_directory(params.get('path', '.')),
+    }
     
     def get_capabilities(self) -> List[str]:
         return ['create_folder', 'create_file', 'delete', 'copy', 'move', 'list']
@@ -69,10 +161,13 @@ class LinuxFilesystemAdapter(BaseFilesystemAdapter):
             path = name
         
         try:
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            with open(path, 'w', encoding='utf-8') as f:
+            directory = os.path.dirname(path)
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory, exist_ok=True)
+            # Permissions are set at creation (subject to umask) instead of a separate chmod
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            with open(fd, 'w', encoding='utf-8') as f:
                 f.write(content)
-            os.chmod(path, 0o644)
             return True
         except Exception as e:
             raise Exception(f"Failed to create file: {e}")
@@ -83,7 +178,11 @@ class LinuxFilesystemAdapter(BaseFilesystemAdapter):
                 os.remove(path)
             elif os.path.isdir(path):
                 if recursive:
-                    shutil.rmtree(path)
+                    # Symlinked directories go to rmtree, which refuses them as before
+                    if not os.path.islink(path) and _filesystem_type(path) in _NETWORK_FILESYSTEMS:
+                        _parallel_rmtree(path)
+                    else:
+                        shutil.rmtree(path)
                 else:
                     os.rmdir(path)
             return True
@@ -93,9 +192,9 @@ class LinuxFilesystemAdapter(BaseFilesystemAdapter):
     def copy(self, source: str, destination: str) -> bool:
         try:
             if os.path.isfile(source):
-                shutil.copy2(source, destination)
+                _fast_copy(source, destination)
             elif os.path.isdir(source):
-                shutil.copytree(source, destination)
+                shutil.copytree(source, destination, copy_function=_fast_copy)
             return True
         except Exception as e:
             raise Exception(f"Failed to copy: {e}")
@@ -110,17 +209,18 @@ class LinuxFilesystemAdapter(BaseFilesystemAdapter):
     def list_directory(self, path: str) -> List[Dict[str, Any]]:
         try:
             items = []
-            for item in os.listdir(path):
-                item_path = os.path.join(path, item)
-                stat = os.stat(item_path)
-                items.append({
-                    'name': item,
-                    'path': item_path,
-                    'type': 'directory' if os.path.isdir(item_path) else 'file',
-                    'size': stat.st_size,
-                    'modified': stat.st_mtime,
-                    'permissions': oct(stat.st_mode)[-3:]
-                })
+            # scandir reports the entry type from readdir, so each entry costs one stat
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    stat = entry.stat()
+                    items.append({
+                        'name': entry.name,
+                        'path': entry.path,
+                        'type': 'directory' if entry.is_dir() else 'file',
+                        'size': stat.st_size,
+                        'modified': stat.st_mtime,
+                        'permissions': oct(stat.st_mode)[-3:]
+                    })
             return items
         except Exception as e:
             raise Exception(f"Failed to list directory: {e}")
@@ -146,15 +246,32 @@ class LinuxFilesystemAdapter(BaseFilesystemAdapter):
 class LinuxProcessAdapter(BaseProcessAdapter):
     """Linux process management"""
     
-    def execute(self, action: str, params: Dict[str, Any]) -> Any:
-        if action == 'start':
-            return self.start_process(params.get('program'), params.get('args'))
-        elif action == 'terminate':
-            return self.terminate_process(params.get('program'))
-        elif action == 'list':
-            return self.list_processes()
-        else:
-            raise ValueError(f"Unknown process action: {action}")
+    __slots__ = ('_processes', '_cpu_ticks', '_cpu_sample_time')
+    
+    def __init__(self):
+        # pid -> psutil.Process, so repeated calls reuse one object (and get real cpu_percent deltas)
+        self._processes: Dict[int, 'psutil.Process'] = {}
+        # Previous /proc scan: pid -> (start time, CPU ticks), and when it was taken
+        self._cpu_ticks: Dict[int, tuple] = {}
+        self._cpu_sample_time = None
+    
+    def _get_process(self, pid: int) -> 'psutil.Process':
+        """Get a cached Process for pid, replacing it if the pid was reused"""
+        import psutil
+        
+        proc = self._processes.get(pid)
+        # is_running() compares the creation time, so a recycled pid is detected
+        if proc is None or not proc.is_running():
+            self._processes.pop(pid, None)
+            proc = psutil.Process(pid)
+            self._processes[pid] = proc
+        return proc
+    
+    _ACTIONS = {
+        'start': lambda self, params: self.start_process(params.get('program'), params.get('args')),
+        'terminate': lambda self, params: self.terminate_process(params.get('program')),
+        'list': lambda self, params: self.list_processes(),
+    }
     
     def get_capabilities(self) -> List[str]:
         return ['start', 'terminate', 'list']
@@ -164,11 +281,13 @@ class LinuxProcessAdapter(BaseProcessAdapter):
             cmd = [program]
             if args:
                 if isinstance(args, str):
-                    cmd.extend(args.split())
+                    # Honour quoting, e.g. "/opt/my app/file.txt"
+                    cmd.extend(shlex.split(args))
                 else:
                     cmd.extend(args)
             
-            process = subprocess.Popen(cmd)
+            # Own session: the launched program does not get the automator's terminal signals
+            process = subprocess.Popen(cmd, close_fds=True, start_new_session=True)
             return process.pid
         except Exception as e:
             raise Exception(f"Failed to start process: {e}")
@@ -176,46 +295,125 @@ class LinuxProcessAdapter(BaseProcessAdapter):
     def terminate_process(self, pid_or_name: Any) -> bool:
         try:
             if isinstance(pid_or_name, int):
-                process = psutil.Process(pid_or_name)
-                process.terminate()
+                import psutil
+                
+                try:
+                    self._get_process(pid_or_name).terminate()
+                except psutil.NoSuchProcess:
+                    self._processes.pop(pid_or_name, None)
+                    raise
             else:
-                # Use pkill for name-based termination
-                subprocess.run(['pkill', '-f', pid_or_name], check=True)
+                self._terminate_matching(pid_or_name)
             return True
         except Exception as e:
             raise Exception(f"Failed to terminate process: {e}")
     
+    @staticmethod
+    def _terminate_matching(pattern: str):
+        """SIGTERM every process whose command line matches pattern, like `pkill -f`"""
+        regex = re.compile(pattern)
+        own_pid = os.getpid()
+        matched = signalled = 0
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit() or int(entry) == own_pid:
+                continue
+            try:
+                with open(f'/proc/{entry}/cmdline', 'rb') as f:
+                    cmdline = f.read()
+                if not cmdline:
+                    # Kernel threads and zombies have no command line; pkill matches their name
+                    with open(f'/proc/{entry}/comm', 'rb') as f:
+                        cmdline = f.read()
+                command = cmdline.rstrip(b'\0\n').replace(b'\0', b' ').decode('utf-8', 'replace')
+            except OSError:
+                continue  # Exited while scanning
+            if not regex.search(command):
+                continue
+            matched += 1
+            try:
+                os.kill(int(entry), signal.SIGTERM)
+                signalled += 1
+            except ProcessLookupError:
+                pass
+            except PermissionError:
+                continue
+        if not matched:
+            raise ProcessLookupError(f"No process matches {pattern!r}")
+        if not signalled:
+            raise PermissionError(f"Not permitted to terminate processes matching {pattern!r}")
+    
     def list_processes(self) -> List[Dict[str, Any]]:
         try:
+            # Read /proc directly: one stat and one status read per process,
+            # without psutil's per-attribute dispatch
+            now = time.monotonic()
+            elapsed = now - self._cpu_sample_time if self._cpu_sample_time is not None else 0.0
+            previous, current = self._cpu_ticks, {}
             processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_info', 'username']):
-                try:
-                    processes.append({
-                        'pid': proc.info['pid'],
-                        'name': proc.info['name'],
-                        'cpu_percent': proc.info['cpu_percent'],
-                        'memory_mb': proc.info['memory_info'].rss / 1024 / 1024,
-                        'username': proc.info['username']
-                    })
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
+            for entry in os.listdir('/proc'):
+                if not entry.isdigit():
                     continue
+                try:
+                    with open(f'/proc/{entry}/stat', 'rb') as f:
+                        stat = f.read()
+                    with open(f'/proc/{entry}/status', 'rb') as f:
+                        status = f.read()
+                    # comm may contain spaces and parentheses, so split on the last ')'
+                    open_paren = stat.find(b'(')
+                    close_paren = stat.rfind(b')')
+                    name = stat[open_paren + 1:close_paren].decode('utf-8', 'replace')
+                    fields = stat[close_paren + 2:].split()
+                    if len(name) >= _COMM_MAX_LEN:
+                        with open(f'/proc/{entry}/cmdline', 'rb') as f:
+                            exe = os.path.basename(f.read().split(b'\0', 1)[0].decode('utf-8', 'replace'))
+                        if exe.startswith(name):
+                            name = exe
+                except OSError:
+                    continue  # Exited while scanning
+                
+                pid = int(entry)
+                # Fields after comm start at field 3 (state); see proc(5)
+                ticks = int(fields[11]) + int(fields[12])
+                start_time = fields[19]
+                current[pid] = (start_time, ticks)
+                cpu_percent = 0.0
+                last = previous.get(pid)
+                if elapsed > 0 and last is not None and last[0] == start_time:
+                    cpu_percent = round((ticks - last[1]) / _CLK_TCK / elapsed * 100, 1)
+                
+                uid_start = status.find(b'\nUid:') + 5
+                uid = int(status[uid_start:status.index(b'\n', uid_start)].split()[0])
+                processes.append({
+                    'pid': pid,
+                    'name': name,
+                    'cpu_percent': cpu_percent,
+                    'memory_mb': int(fields[21]) * _PAGE_SIZE / 1024 / 1024,
+                    'username': _uid_to_name(uid)
+                })
+            self._cpu_ticks, self._cpu_sample_time = current, now
             return processes
         except Exception as e:
             raise Exception(f"Failed to list processes: {e}")
     
     def get_process_info(self, pid: int) -> Dict[str, Any]:
+        import psutil
+        
         try:
-            proc = psutil.Process(pid)
-            return {
-                'pid': proc.pid,
-                'name': proc.name(),
-                'status': proc.status(),
-                'cpu_percent': proc.cpu_percent(),
-                'memory_info': proc.memory_info()._asdict(),
-                'create_time': proc.create_time(),
-                'username': proc.username(),
-                'cwd': proc.cwd()
-            }
+            proc = self._get_process(pid)
+            with proc.oneshot():
+                return {
+                    'pid': proc.pid,
+                    'name': proc.name(),
+                    'status': proc.status(),
+                    'cpu_percent': proc.cpu_percent(),
+                    'memory_info': proc.memory_info()._asdict(),
+                    'create_time': proc.create_time(),
+                    'username': proc.username(),
+                    'cwd': proc.cwd()
+                }
+        except psutil.NoSuchProcess as e:
+            self._processes.pop(pid, None)
+            raise Exception(f"Failed to get process info: {e}")
         except Exception as e:
             raise Exception(f"Failed to get process info: {e}")
 
@@ -223,24 +421,22 @@ class LinuxProcessAdapter(BaseProcessAdapter):
 class LinuxGUIAdapter(BaseGUIAdapter):
     """Linux GUI automation using X11"""
     
+    __slots__ = ('_shot_cmd',)
+    
     def __init__(self):
+        import pyautogui
+        
         pyautogui.FAILSAFE = True
         pyautogui.PAUSE = 0.1
+        self._shot_cmd = self._find_screenshot_command()
     
-    def execute(self, action: str, params: Dict[str, Any]) -> Any:
-        if action == 'click':
-            return self.click(params.get('x'), params.get('y'), params.get('button', 'left'))
-        elif action == 'type':
-            return self.type_text(params.get('text'))
-        elif action == 'press_key':
-            return self.press_key(params.get('key'))
-        elif action == 'screenshot':
-            return self.take_screenshot(params.get('filename'))
-        elif action == 'wait':
-            time.sleep(float(params.get('duration', 1)))
-            return True
-        else:
-            raise ValueError(f"Unknown GUI action: {action}")
+    _ACTIONS = {
+        'click': lambda self, params: self.click(params.get('x'), params.get('y'), params.get('button', 'left')),
+        'type': lambda self, params: self.type_text(params.get('text')),
+        'press_key': lambda self, params: self.press_key(params.get('key')),
+        'screenshot': lambda self, params: self.take_screenshot(params.get('filename')),
+        'wait': lambda self, params: self.wait(float(params.get('duration', 1))),
+    }
     
     def get_capabilities(self) -> List[str]:
         # Include GUI controls and Linux-specific headless/browser helpers
@@ -248,6 +444,8 @@ class LinuxGUIAdapter(BaseGUIAdapter):
     
     def click(self, x: int = None, y: int = None, button: str = 'left') -> bool:
         try:
+            import pyautogui
+            
             if x is not None and y is not None:
                 pyautogui.click(x, y, button=button)
             else:
@@ -258,6 +456,8 @@ class LinuxGUIAdapter(BaseGUIAdapter):
     
     def type_text(self, text: str) -> bool:
         try:
+            import pyautogui
+            
             pyautogui.typewrite(text)
             return True
         except Exception as e:
@@ -265,21 +465,40 @@ class LinuxGUIAdapter(BaseGUIAdapter):
     
     def press_key(self, key: str) -> bool:
         try:
+            import pyautogui
+            
             pyautogui.press(key)
             return True
         except Exception as e:
             raise Exception(f"Failed to press key: {e}")
     
+    @staticmethod
+    def _find_screenshot_command() -> Optional[List[str]]:
+        """Pick the screenshot tool for this session type, once"""
+        # scrot and maim grab X11 only; under Wayland that would be a blank or failed shot
+        if os.environ.get('XDG_SESSION_TYPE') == 'wayland' or os.environ.get('WAYLAND_DISPLAY'):
+            candidates = (['grim'],)
+        else:
+            candidates = (['maim'], ['scrot'])
+        for command in candidates:
+            if shutil.which(command[0]):
+                return command
+        return None
+    
     def take_screenshot(self, filename: str = None) -> str:
         try:
             if not filename:
                 filename = f"screenshot_{int(time.time())}.png"
             
-            # Use scrot for better Linux screenshot support
             try:
-                subprocess.run(['scrot', filename], check=True)
+                if self._shot_cmd is None:
+                    raise FileNotFoundError("No screenshot tool found")
+                subprocess.run(self._shot_cmd + [filename], check=True,
+                               stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
             except (subprocess.CalledProcessError, FileNotFoundError):
                 # Fallback to pyautogui
+                import pyautogui
+                
                 screenshot = pyautogui.screenshot()
                 screenshot.save(filename)
             
@@ -287,9 +506,21 @@ class LinuxGUIAdapter(BaseGUIAdapter):
         except Exception as e:
             raise Exception(f"Failed to take screenshot: {e}")
     
-    def find_element(self, image_path: str) -> Dict[str, int]:
+    def find_element(self, image_path: str, confidence: float = None) -> Dict[str, int]:
         try:
-            location = pyautogui.locateOnScreen(image_path)
+            import pyautogui
+            
+            location = None
+            if confidence is not None:
+                try:
+                    # Opt-in fuzzy match: pyautogui uses cv2.matchTemplate on the
+                    # grayscale template, which is reused until the file changes
+                    template = _load_template(image_path, os.stat(image_path).st_mtime_ns)
+                    location = pyautogui.locateOnScreen(template, grayscale=True, confidence=confidence)
+                except ImportError:
+                    confidence = None  # No OpenCV: fall back to the exact match
+            if confidence is None:
+                location = pyautogui.locateOnScreen(image_path)
             if location:
                 center = pyautogui.center(location)
                 return {'x': center.x, 'y': center.y}
@@ -302,15 +533,18 @@ class LinuxGUIAdapter(BaseGUIAdapter):
 class LinuxSystemAdapter(BaseSystemAdapter):
     """Linux system operations"""
     
-    def execute(self, action: str, params: Dict[str, Any]) -> Any:
-        if action == 'get_info':
-            return self.get_system_info()
-        elif action == 'set_volume':
-            return self.set_volume(int(params.get('level', 50)))
-        elif action == 'power_action':
-            return self.power_action(params.get('action'))
-        else:
-            raise ValueError(f"Unknown system action: {action}")
+    __slots__ = ('_disk_usage', '_disk_usage_time')
+    
+    def __init__(self):
+        # Root filesystem usage, re-read at most every _DISK_USAGE_TTL seconds
+        self._disk_usage = None
+        self._disk_usage_time = 0.0
+    
+    _ACTIONS = {
+        'get_info': lambda self, params: self.get_system_info(),
+        'set_volume': lambda self, params: self.set_volume(int(params.get('level', 50))),
+        'power_action': lambda self, params: self.power_action(params.get('action')),
+    }
     
     def get_capabilities(self) -> List[str]:
         return ['get_info', 'set_volume', 'power_action']
@@ -318,18 +552,19 @@ class LinuxSystemAdapter(BaseSystemAdapter):
     def get_system_info(self) -> Dict[str, Any]:
         try:
             import platform
+            import psutil
             
             # Get additional Linux-specific info
             distro_info = {}
             try:
                 with open('/etc/os-release', 'r') as f:
-                    for line in f:
-                        if '=' in line:
-                            key, value = line.strip().split('=', 1)
-                            distro_info[key] = value.strip('"')
+                    distro_info = dict(_OS_RELEASE_LINE.findall(f.read()))
             except FileNotFoundError:
                 pass
             
+            # One snapshot, so total and available are consistent with each other
+            memory = psutil.virtual_memory()
+            
             return {
                 'platform': platform.platform(),
                 'system': platform.system(),
@@ -338,18 +573,28 @@ class LinuxSystemAdapter(BaseSystemAdapter):
                 'machine': platform.machine(),
                 'processor': platform.processor(),
                 'cpu_count': psutil.cpu_count(),
-                'memory_total': psutil.virtual_memory().total,
-                'memory_available': psutil.virtual_memory().available,
-                'disk_usage': {
-                    'total': psutil.disk_usage('/').total,
-                    'used': psutil.disk_usage('/').used,
-                    'free': psutil.disk_usage('/').free
-                },
+                'memory_total': memory.total,
+                'memory_available': memory.available,
+                'disk_usage': dict(self._get_disk_usage()),
                 'distro_info': distro_info
             }
         except Exception as e:
             raise Exception(f"Failed to get system info: {e}")
     
+    def _get_disk_usage(self) -> Dict[str, int]:
+        """Usage of the root filesystem from one statvfs, with psutil.disk_usage's semantics"""
+        now = time.monotonic()
+        if self._disk_usage is None or now - self._disk_usage_time >= _DISK_USAGE_TTL:
+            st = os.statvfs('/')
+            total = st.f_blocks * st.f_frsize
+            self._disk_usage = {
+                'total': total,
+                'used': total - st.f_bfree * st.f_frsize,  # Includes root-reserved blocks
+                'free': st.f_bavail * st.f_frsize          # Available to unprivileged users
+            }
+            self._disk_usage_time = now
+        return self._disk_usage
+    
     def set_volume(self, level: int) -> bool:
         try:
             # Try different volume control methods
@@ -394,28 +639,34 @@ class LinuxSystemAdapter(BaseSystemAdapter):
 class LinuxNetworkAdapter(BaseNetworkAdapter):
     """Linux network operations - same as Windows"""
     
-    def execute(self, action: str, params: Dict[str, Any]) -> Any:
-        if action == 'download':
-            return self.download_file(params.get('url'), params.get('filename'))
-        elif action == 'http_get':
-            return self.http_request('GET', params.get('url'))
-        else:
-            raise ValueError(f"Unknown network action: {action}")
+    __slots__ = ('_session',)
+    
+    def __init__(self):
+        import requests
+        
+        # One session so repeated requests to a host reuse pooled keep-alive connections
+        self._session = requests.Session()
+    
+    _ACTIONS = {
+        'download': lambda self, params: self.download_file(params.get('url'), params.get('filename')),
+        'http_get': lambda self, params: self.http_request('GET', params.get('url')),
+    }
     
     def get_capabilities(self) -> List[str]:
         return ['download', 'http_get', 'http_post']
     
     def download_file(self, url: str, filename: str = None) -> str:
         try:
-            response = requests.get(url, stream=True)
-            response.raise_for_status()
-            
-            if not filename:
-                filename = url.split('/')[-1] or 'downloaded_file'
-            
-            with open(filename, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            with self._session.get(url, stream=True) as response:
+                response.raise_for_status()
+                
+                if not filename:
+                    filename = url.split('/')[-1] or 'downloaded_file'
+                
+                # Copy in 1 MiB blocks; decode_content keeps gzip/deflate handling of iter_content
+                response.raw.decode_content = True
+                with open(filename, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, _DOWNLOAD_CHUNK_SIZE)
             
             return filename
         except Exception as e:
@@ -423,7 +674,7 @@ class LinuxNetworkAdapter(BaseNetworkAdapter):
     
     def http_request(self, method: str, url: str, **kwargs) -> Dict[str, Any]:
         try:
-            response = requests.request(method, url, **kwargs)
+            response = self._session.request(method, url, **kwargs)
             return {
                 'status_code': response.status_code,
                 'headers': dict(response.headers),
@@ -436,16 +687,29 @@ class LinuxNetworkAdapter(BaseNetworkAdapter):
     def get_network_info(self) -> Dict[str, Any]:
         try:
             import socket
+            import psutil
+            
+            hostname = socket.gethostname()
+            interfaces = psutil.net_if_addrs()
+            try:
+                ip_address = socket.gethostbyname(hostname)
+            except OSError:
+                # Hostname does not resolve; use the first non-loopback IPv4 address
+                ip_address = next(
+                    (addr.address for addrs in interfaces.values() for addr in addrs
+                     if addr.family == socket.AF_INET and not addr.address.startswith('127.')),
+                    '127.0.0.1'
+                )
             
             return {
-                'hostname': socket.gethostname(),
-                'ip_address': socket.gethostbyname(socket.gethostname()),
+                'hostname': hostname,
+                'ip_address': ip_address,
                 'network_interfaces': [
                     {
                         'name': interface,
                         'addresses': [addr.address for addr in addrs]
                     }
-                    for interface, addrs in psutil.net_if_addrs().items()
+                    for interface, addrs in interfaces.items()
                 ]
             }
         except Exception as e:
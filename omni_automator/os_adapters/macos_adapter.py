@@ -29,21 +29,14 @@ except ImportError:
 class MacOSFilesystemAdapter(BaseFilesystemAdapter):
     """macOS filesystem operations"""
     
-    def execute(self, action: str, params: Dict[str, Any]) -> Any:
-        if action == 'create_folder':
-            return self.create_folder(params.get('name'), params.get('location'))
-        elif action == 'create_file':
-            return self.create_file(params.get('name'), params.get('location'))
-        elif action == 'delete':
-            return self.delete(params.get('path'))
-        elif action == 'copy':
-            return self.copy(params.get('source'), params.get('destination'))
-        elif action == 'move':
-            return self.move(params.get('source'), params.get('destination'))
-        elif action == 'list':
-            return self.list_directory(params.get('path', '.'))
-        else:
-            raise ValueError(f"Unknown filesystem action: {action}")
+    _ACTIONS = {
+        'create_folder': lambda self, params: self.create_folder(params.get('name'), params.get('location')),
+        'create_file': lambda self, params: self.create_file(params.get('name'), params.get('location')),
+        'delete': lambda self, params: self.delete(params.get('path')),
+        'copy': lambda self, params: self.copy(params.get('source'), params.get('destination')),
+        'move': lambda self, params: self.move(params.get('source'), params.get('destination')),
+        'list': lambda self, params: self.list_directory(params.get('path', '.')),
+    }
     
     def get_capabilities(self) -> List[str]:
         return ['create_folder', 'create_file', 'delete', 'copy', 'move', 'list']
@@ -148,15 +141,11 @@ class MacOSFilesystemAdapter(BaseFilesystemAdapter):
 class MacOSProcessAdapter(BaseProcessAdapter):
     """macOS process management"""
     
-    def execute(self, action: str, params: Dict[str, Any]) -> Any:
-        if action == 'start':
-            return self.start_process(params.get('program'), params.get('args'))
-        elif action == 'terminate':
-            return self.terminate_process(params.get('program'))
-        elif action == 'list':
-            return self.list_processes()
-        else:
-            raise ValueError(f"Unknown process action: {action}")
+    _ACTIONS = {
+        'start': lambda self, params: self.start_process(params.get('program'), params.get('args')),
+        'terminate': lambda self, params: self.terminate_process(params.get('program')),
+        'list': lambda self, params: self.list_processes(),
+    }
     
     def get_capabilities(self) -> List[str]:
         return ['start', 'terminate', 'list']
@@ -232,20 +221,13 @@ class MacOSGUIAdapter(BaseGUIAdapter):
         pyautogui.FAILSAFE = True
         pyautogui.PAUSE = 0.1
     
-    def execute(self, action: str, params: Dict[str, Any]) -> Any:
-        if action == 'click':
-            return self.click(params.get('x'), params.get('y'), params.get('button', 'left'))
-        elif action == 'type':
-            return self.type_text(params.get('text'))
-        elif action == 'press_key':
-            return self.press_key(params.get('key'))
-        elif action == 'screenshot':
-            return self.take_screenshot(params.get('filename'))
-        elif action == 'wait':
-            time.sleep(float(params.get('duration', 1)))
-            return True
-        else:
-            raise ValueError(f"Unknown GUI action: {action}")
+    _ACTIONS = {
+        'click': lambda self, params: self.click(params.get('x'), params.get('y'), params.get('button', 'left')),
+        'type': lambda self, params: self.type_text(params.get('text')),
+        'press_key': lambda self, params: self.press_key(params.get('key')),
+        'screenshot': lambda self, params: self.take_screenshot(params.get('filename')),
+        'wait': lambda self, params: self.wait(float(params.get('duration', 1))),
+    }
     
     def get_capabilities(self) -> List[str]:
         return ['click', 'type', 'press_key', 'screenshot', 'wait']
@@ -306,15 +288,11 @@ class MacOSGUIAdapter(BaseGUIAdapter):
 class MacOSSystemAdapter(BaseSystemAdapter):
     """macOS system operations"""
     
-    def execute(self, action: str, params: Dict[str, Any]) -> Any:
-        if action == 'get_info':
-            return self.get_system_info()
-        elif action == 'set_volume':
-            return self.set_volume(int(params.get('level', 50)))
-        elif action == 'power_action':
-            return self.power_action(params.get('action'))
-        else:
-            raise ValueError(f"Unknown system action: {action}")
+    _ACTIONS = {
+        'get_info': lambda self, params: self.get_system_info(),
+        'set_volume': lambda self, params: self.set_volume(int(params.get('level', 50))),
+        'power_action': lambda self, params: self.power_action(params.get('action')),
+    }
     
     def get_capabilities(self) -> List[str]:
         return ['get_info', 'set_volume', 'power_action']
@@ -379,13 +357,10 @@ class MacOSSystemAdapter(BaseSystemAdapter):
 class MacOSNetworkAdapter(BaseNetworkAdapter):
     """macOS network operations - same as other platforms"""
     
-    def execute(self, action: str, params: Dict[str, Any]) -> Any:
-        if action == 'download':
-            return self.download_file(params.get('url'), params.get('filename'))
-        elif action == 'http_get':
-            return self.http_request('GET', params.get('url'))
-        else:
-            raise ValueError(f"Unknown network action: {action}")
+    _ACTIONS = {
+        'download': lambda self, params: self.download_file(params.get('url'), params.get('filename')),
+        'http_get': lambda self, params: self.http_request('GET', params.get('url')),
+    }
     
     def get_capabilities(self) -> List[str]:
         return ['download', 'http_get', 'http_post']
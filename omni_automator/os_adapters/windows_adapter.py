@@ -3,10 +3,13 @@ Windows-specific OS adapter implementation
 """
 
 import os
+import re
 import sys
+import ctypes
 import shutil
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 import psutil
 import pyautogui
 import requests
@@ -29,6 +32,23 @@ try:
 except ImportError:
     HAS_WIN32 = False
 
+# Batch folder names like "project1": base name and number
+_BATCH_NAME_RE = re.compile(r'([a-zA-Z_]+)(\d+)')
+_DRIVE_REMOTE = 4  # GetDriveTypeW result for a network drive
+_BATCH_WORKERS = 16
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _is_network_path(path: str) -> bool:
+    """Check whether path is on a UNC share or a mapped network drive"""
+    drive = os.path.splitdrive(os.path.abspath(path))[0]
+    if drive.startswith('\\\\'):
+        return True
+    try:
+        return ctypes.windll.kernel32.GetDriveTypeW(drive + '\\') == _DRIVE_REMOTE
+    except (AttributeError, OSError):
+        return False
+
 
 class WindowsFilesystemAdapter(BaseFilesystemAdapter):
     """Windows filesystem operations"""
@@ -112,19 +132,27 @@ class WindowsFilesystemAdapter(BaseFilesystemAdapter):
             if '..' in path:
                 raise ValueError("Invalid path detected - path traversal not allowed")
             
-            os.makedirs(path, exist_ok=True)
+            self._make_folder(path)
             return True
         except Exception as e:
             raise Exception(f"Failed to create folder '{name}': {e}")
     
+    @staticmethod
+    def _make_folder(path: str):
+        """Create a folder with a single mkdir when its parent exists, like os.makedirs(exist_ok=True)"""
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            if not os.path.isdir(path):
+                raise
+        except FileNotFoundError:
+            os.makedirs(path, exist_ok=True)  # Parent missing
+    
     def create_folders_batch(self, count: int, start_name: str, end_name: str, location: str = None) -> dict:
         """Create multiple folders with names generated from start_name to end_name"""
         try:
-            # Extract base name and number from start_name
-            import re
-            
-            # Match pattern like "project1"
-            match = re.match(r'([a-zA-Z_]+)(\d+)', start_name)
+            # Extract base name and number from start_name, e.g. "project1"
+            match = _BATCH_NAME_RE.match(start_name)
             if not match:
                 raise ValueError(f"Invalid start_name format: {start_name}. Expected format like 'project1'")
             
@@ -132,7 +160,7 @@ class WindowsFilesystemAdapter(BaseFilesystemAdapter):
             start_num = int(match.group(2))
             
             # Extract number from end_name
-            match_end = re.match(r'([a-zA-Z_]+)(\d+)', end_name)
+            match_end = _BATCH_NAME_RE.match(end_name)
             if not match_end:
                 raise ValueError(f"Invalid end_name format: {end_name}. Expected format like 'project10'")
             
@@ -142,19 +170,48 @@ class WindowsFilesystemAdapter(BaseFilesystemAdapter):
             if base_name != match_end.group(1):
                 raise ValueError(f"Base names don't match: {base_name} vs {match_end.group(1)}")
             
+            # Generated names are letters, underscores and digits, so they need no
+            # sanitizing; validate and create the location once instead of per folder
+            direct = location is None or (isinstance(location, str) and '..' not in location)
+            if direct and location and not os.path.isdir(location):
+                try:
+                    os.makedirs(location, exist_ok=True)
+                except OSError:
+                    direct = False  # Let create_folder report the error for each folder
+            
+            def create(folder_name: str) -> Optional[str]:
+                """Create one folder, returning the error message on failure"""
+                try:
+                    if direct:
+                        try:
+                            self._make_folder(os.path.join(location, folder_name) if location else folder_name)
+                        except OSError as e:
+                            raise Exception(f"Failed to create folder '{folder_name}': {e}")
+                    else:
+                        self.create_folder(folder_name, location)
+                    return None
+                except Exception as e:
+                    return str(e)
+            
             # Generate folder names and create them
+            folder_names = [f"{base_name}{num}" for num in range(start_num, end_num + 1)]
+            # On a network share each mkdir is a server round trip, so overlap them;
+            # locally they are cheap and mostly serialize on the parent directory anyway
+            if len(folder_names) > 1 and _is_network_path(location or '.'):
+                with ThreadPoolExecutor(max_workers=min(_BATCH_WORKERS, len(folder_names))) as pool:
+                    errors = list(pool.map(create, folder_names))
+            else:
+                errors = [create(folder_name) for folder_name in folder_names]
+            
             created_folders = []
             failed_folders = []
-            
-            for num in range(start_num, end_num + 1):
-                folder_name = f"{base_name}{num}"
-                try:
-                    self.create_folder(folder_name, location)
+            for folder_name, error in zip(folder_names, errors):
+                if error is None:
                     created_folders.append(folder_name)
-                except Exception as e:
+                else:
                     failed_folders.append({
                         'name': folder_name,
-                        'error': str(e)
+                        'error': error
                     })
             
             return {
@@ -255,16 +312,18 @@ class WindowsFilesystemAdapter(BaseFilesystemAdapter):
         """List directory contents"""
         try:
             items = []
-            for item in os.listdir(path):
-                item_path = os.path.join(path, item)
-                stat = os.stat(item_path)
-                items.append({
-                    'name': item,
-                    'path': item_path,
-                    'type': 'directory' if os.path.isdir(item_path) else 'file',
-                    'size': stat.st_size,
-                    'modified': stat.st_mtime
-                })
+            # FindNextFileW already returns each entry's attributes, size and times,
+            # so scandir needs no per-entry syscall (except to follow symlinks)
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    stat = entry.stat()
+                    items.append({
+                        'name': entry.name,
+                        'path': entry.path,
+                        'type': 'directory' if entry.is_dir() else 'file',
+                        'size': stat.st_size,
+                        'modified': stat.st_mtime
+                    })
             return items
         except Exception as e:
             raise Exception(f"Failed to list directory: {e}")
@@ -288,19 +347,18 @@ class WindowsFilesystemAdapter(BaseFilesystemAdapter):
 class WindowsProcessAdapter(BaseProcessAdapter):
     """Windows process management"""
     
-    def execute(self, action: str, params: Dict[str, Any]) -> Any:
-        """Execute process action"""
-        if action == 'start' or action == 'launch_application':
-            # Accept both 'start' and 'launch_application' as aliases
-            # normalize parameter names: program or application or exe
-            prog = params.get('program') or params.get('application') or params.get('exe') or params.get('path')
-            return self.start_process(prog, params.get('args'))
-        elif action == 'terminate':
-            return self.terminate_process(params.get('program'))
-        elif action == 'list':
-            return self.list_processes()
-        else:
-            raise ValueError(f"Unknown process action: {action}")
+    def _start_from_params(self, params: Dict[str, Any]) -> int:
+        """Start a process, accepting program/application/exe/path as the program name"""
+        prog = params.get('program') or params.get('application') or params.get('exe') or params.get('path')
+        return self.start_process(prog, params.get('args'))
+    
+    _ACTIONS = {
+        # 'launch_application' is an alias of 'start'
+        'start': _start_from_params,
+        'launch_application': _start_from_params,
+        'terminate': lambda self, params: self.terminate_process(params.get('program')),
+        'list': lambda self, params: self.list_processes(),
+    }
     
     def get_capabilities(self) -> List[str]:
         return ['start', 'launch_application', 'terminate', 'list']
@@ -328,10 +386,22 @@ class WindowsProcessAdapter(BaseProcessAdapter):
                 process = psutil.Process(pid_or_name)
                 process.terminate()
             else:
-                # Terminate by name
-                for proc in psutil.process_iter(['pid', 'name']):
-                    if proc.info['name'].lower() == pid_or_name.lower():
-                        proc.terminate()
+                # Terminate by name; only the name is fetched for each process
+                target = pid_or_name.lower()
+                matched = terminated = 0
+                for proc in psutil.process_iter(['name']):
+                    name = proc.info['name']
+                    if name and name.lower() == target:
+                        matched += 1
+                        try:
+                            proc.terminate()
+                        except psutil.AccessDenied:
+                            continue
+                        except psutil.NoSuchProcess:
+                            pass  # Already exited
+                        terminated += 1
+                if matched and not terminated:
+                    raise PermissionError(f"Not permitted to terminate processes named {pid_or_name!r}")
             return True
         except Exception as e:
             raise Exception(f"Failed to terminate process: {e}")
@@ -377,25 +447,15 @@ class WindowsGUIAdapter(BaseGUIAdapter):
         pyautogui.FAILSAFE = True
         pyautogui.PAUSE = 0.1
     
-    def execute(self, action: str, params: Dict[str, Any]) -> Any:
-        """Execute GUI action"""
-        if action == 'click':
-            return self.click(params.get('x'), params.get('y'), params.get('button', 'left'))
-        elif action == 'type':
-            return self.type_text(params.get('text'))
-        elif action == 'press_key':
-            return self.press_key(params.get('key'))
-        elif action == 'screenshot':
-            return self.take_screenshot(params.get('filename'))
-        elif action == 'wait':
-            time.sleep(float(params.get('duration', 1)))
-            return True
-        elif action == 'wait_for_page_load':
-            # Best-effort: wait a short time for browser to load content
-            time.sleep(float(params.get('timeout', 2)))
-            return True
-        else:
-            raise ValueError(f"Unknown GUI action: {action}")
+    _ACTIONS = {
+        'click': lambda self, params: self.click(params.get('x'), params.get('y'), params.get('button', 'left')),
+        'type': lambda self, params: self.type_text(params.get('text')),
+        'press_key': lambda self, params: self.press_key(params.get('key')),
+        'screenshot': lambda self, params: self.take_screenshot(params.get('filename')),
+        'wait': lambda self, params: self.wait(float(params.get('duration', 1))),
+        # Best-effort: wait a short time for browser to load content
+        'wait_for_page_load': lambda self, params: self.wait(float(params.get('timeout', 2))),
+    }
     
     def get_capabilities(self) -> List[str]:
         # Windows GUI capabilities (no headless browser on Windows)
@@ -456,16 +516,11 @@ class WindowsGUIAdapter(BaseGUIAdapter):
 class WindowsSystemAdapter(BaseSystemAdapter):
     """Windows system operations"""
     
-    def execute(self, action: str, params: Dict[str, Any]) -> Any:
-        """Execute system action"""
-        if action == 'get_info':
-            return self.get_system_info()
-        elif action == 'set_volume':
-            return self.set_volume(int(params.get('level', 50)))
-        elif action == 'power_action':
-            return self.power_action(params.get('action'))
-        else:
-            raise ValueError(f"Unknown system action: {action}")
+    _ACTIONS = {
+        'get_info': lambda self, params: self.get_system_info(),
+        'set_volume': lambda self, params: self.set_volume(int(params.get('level', 50))),
+        'power_action': lambda self, params: self.power_action(params.get('action')),
+    }
     
     def get_capabilities(self) -> List[str]:
         return ['get_info', 'set_volume', 'power_action']
@@ -475,6 +530,10 @@ class WindowsSystemAdapter(BaseSystemAdapter):
         try:
             import platform
             
+            # One snapshot each, so the fields are consistent with each other
+            memory = psutil.virtual_memory()
+            disk = psutil.disk_usage('/')
+            
             return {
                 'platform': platform.platform(),
                 'system': platform.system(),
@@ -483,12 +542,12 @@ class WindowsSystemAdapter(BaseSystemAdapter):
                 'machine': platform.machine(),
                 'processor': platform.processor(),
                 'cpu_count': psutil.cpu_count(),
-                'memory_total': psutil.virtual_memory().total,
-                'memory_available': psutil.virtual_memory().available,
+                'memory_total': memory.total,
+                'memory_available': memory.available,
                 'disk_usage': {
-                    'total': psutil.disk_usage('/').total,
-                    'used': psutil.disk_usage('/').used,
-                    'free': psutil.disk_usage('/').free
+                    'total': disk.total,
+                    'used': disk.used,
+                    'free': disk.free
                 }
             }
         except Exception as e:
@@ -538,14 +597,10 @@ class WindowsSystemAdapter(BaseSystemAdapter):
 class WindowsNetworkAdapter(BaseNetworkAdapter):
     """Windows network operations"""
     
-    def execute(self, action: str, params: Dict[str, Any]) -> Any:
-        """Execute network action"""
-        if action == 'download':
-            return self.download_file(params.get('url'), params.get('filename'))
-        elif action == 'http_get':
-            return self.http_request('GET', params.get('url'))
-        else:
-            raise ValueError(f"Unknown network action: {action}")
+    _ACTIONS = {
+        'download': lambda self, params: self.download_file(params.get('url'), params.get('filename')),
+        'http_get': lambda self, params: self.http_request('GET', params.get('url')),
+    }
     
     def get_capabilities(self) -> List[str]:
         return ['download', 'http_get', 'http_post']
@@ -553,15 +608,16 @@ class WindowsNetworkAdapter(BaseNetworkAdapter):
     def download_file(self, url: str, filename: str = None) -> str:
         """Download file from URL"""
         try:
-            response = requests.get(url, stream=True)
-            response.raise_for_status()
-            
-            if not filename:
-                filename = url.split('/')[-1] or 'downloaded_file'
-            
-            with open(filename, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            with requests.get(url, stream=True) as response:
+                response.raise_for_status()
+                
+                if not filename:
+                    filename = url.rsplit('/', 1)[-1] or 'downloaded_file'
+                
+                # Copy in 1 MiB blocks; decode_content keeps gzip/deflate handling of iter_content
+                response.raw.decode_content = True
+                with open(filename, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, _DOWNLOAD_CHUNK_SIZE)
             
             return filename
         except Exception as e:
@@ -1,6 +1,9 @@
 """Project generator plugin for creating programming projects with templates"""
 
 import os
+import json
+from string import Template
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List
 import sys
 
@@ -10,6 +13,166 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from omni_automator.core.plugin_manager import AutomationPlugin
 
 
+def _write_files(files: Dict[str, str]) -> List[str]:
+    """Write several UTF-8 text files concurrently and return their paths"""
+    def write(item):
+        path, content = item
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    with ThreadPoolExecutor(max_workers=min(4, len(files))) as executor:
+        return list(executor.map(write, files.items()))
+
+
+# Static file contents for generated projects, built once at import time
+# C project/program sources
+_C_PROJECT_MAIN = '''#include <stdio.h>\n\nint main() {\n    printf("Hello, C project!\\n");\n    return 0;\n}\n'''
+
+_C_PROJECT_MAKEFILE = 'CC=gcc\\nCFLAGS=-Wall -Wextra -std=c99\\nSRCDIR=src\\nSOURCES=$(wildcard $(SRCDIR)/*.c)\\nTARGET=program\\n\\n$(TARGET): $(SOURCES)\\n\\t$(CC) $(CFLAGS) -o $(TARGET) $(SOURCES)\\n\\nclean:\\n\\trm -f $(TARGET)\\n\\n.PHONY: clean\\n'
+
+_C_PROJECT_README = Template("# $project_name\\n\\nA simple C project.\\n")
+
+_C_PROGRAM_ADDITION = """#include <stdio.h>\n\nint main() {\n    int a = 2;\n    int b = 3;\n    printf("Sum: %d\\n", a + b);\n    return 0;\n}\n"""
+
+_C_PROGRAM_HELLO = """#include <stdio.h>\n\nint main() {\n    printf("Hello, World!\\n");\n    return 0;\n}\n"""
+
+_SCRAPER_MAIN_PY = (
+    "#!/usr/bin/env python3\n"
+    "import requests\n"
+    "from bs4 import BeautifulSoup\n"
+    "import json\n"
+    "from datetime import datetime\n\n"
+    "def scrape_headlines():\n"
+    "    headlines = []\n"
+    "    sources = {'BBC':'https://www.bbc.com/news','Reuters':'https://www.reuters.com'}\n"
+    "    for source_name, url in sources.items():\n"
+    "        try:\n"
+    "            r = requests.get(url, timeout=10)\n"
+    "            soup = BeautifulSoup(r.content, 'html.parser')\n"
+    "            elems = soup.select('h1,h2,h3')[:5]\n"
+    "            for e in elems:\n"
+    "                t = e.get_text(strip=True)\n"
+    "                if len(t) > 20:\n"
+    "                    headlines.append({'source': source_name, 'headline': t, 'timestamp': datetime.now().isoformat(), 'url': url})\n"
+    "        except Exception:\n"
+    "            pass\n"
+    "    return headlines\n\n"
+    "if __name__ == '__main__':\n"
+    "    hs = scrape_headlines()\n"
+    "    with open('headlines.json', 'w', encoding='utf-8') as f:\n"
+    "        json.dump(hs, f, indent=2, ensure_ascii=False)\n"
+)
+
+_SCRAPER_REQUIREMENTS = 'requests>=2.31.0\nbeautifulsoup4>=4.12.0\nlxml>=4.9.0\n'
+
+_SCRAPER_README = Template("""# $project_name
+
+A Python web scraping project for collecting news headlines.
+
+## Installation
+
+```bash
+pip install -r requirements.txt
+```
+
+## Usage
+
+```bash
+python main.py
+```
+
+## Files
+
+- main.py - Main scraper script
+- requirements.txt - Python dependencies
+- headlines.json - Output file (created after running)
+""")
+
+_ANALYSIS_NOTEBOOK_JSON = json.dumps({
+    "cells": [
+        {"cell_type": "markdown", "metadata": {}, "source": ["# Data Analysis Project\n", "\n", "Comprehensive data analysis with automated report generation"]},
+        {"cell_type": "code", "execution_count": None, "metadata": {}, "outputs": [], "source": ["# Import required libraries\n", "import pandas as pd\n", "import numpy as np\n", "import matplotlib.pyplot as plt\n", "import seaborn as sns\n", "from datetime import datetime\n", "\n", "print('📊 Data Analysis Environment Ready!')"]}
+    ],
+    "metadata": {"kernelspec": {"display_name": "Python 3", "language": "python", "name": "python3"}, "language_info": {"name": "python", "version": "3.8.0"}},
+    "nbformat": 4,
+    "nbformat_minor": 4
+}, indent=1)
+
+_DATA_ANALYZER_PY = '''#!/usr/bin/env python3
+"""
+Data Analysis Utilities
+"""
+
+import os
+import sys
+
+import matplotlib
+# Render headless with Agg unless a pyplot backend (e.g. a notebook's) is already active
+if 'matplotlib.pyplot' not in sys.modules:
+    matplotlib.use('Agg')
+
+import pandas as pd
+import numpy as np
+import matplotlib.pyplot as plt
+import seaborn as sns
+from datetime import datetime
+
+class DataAnalyzer:
+    def __init__(self, data_path=None):
+        self.data_path = data_path
+        self.df = None
+    
+    def load_data(self, file_path):
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext == '.csv':
+            self.df = pd.read_csv(file_path)
+        elif ext in ['.xlsx', '.xls']:
+            self.df = pd.read_excel(file_path)
+        elif ext == '.json':
+            self.df = pd.read_json(file_path)
+        else:
+            raise ValueError(f"Unsupported file format: {ext}")
+        return self.df
+'''
+
+_ANALYSIS_REQUIREMENTS = 'jupyter>=1.0.0\npandas>=2.0.0\nnumpy>=1.24.0\nmatplotlib>=3.7.0\nseaborn>=0.12.0\nscipy>=1.10.0\nopenpyxl>=3.1.0\n'
+
+_ANALYSIS_README = Template("""# $project_name
+
+Comprehensive data analysis project with automated report generation.
+
+See notebooks/analysis_notebook.ipynb for examples.
+""")
+
+_SAMPLE_DATA_PY = '''#!/usr/bin/env python3
+"""
+Generate sample data for analysis
+"""
+import pandas as pd
+import numpy as np
+from datetime import datetime, timedelta
+
+def generate_sample_data(n_samples=1000):
+    np.random.seed(42)
+    start_date = datetime.now() - timedelta(days=n_samples)
+    dates = pd.date_range(start_date, periods=n_samples, freq='D')
+    data = {
+        'date': dates,
+        'product': np.random.choice(['Product_A','Product_B','Product_C','Product_D'], n_samples),
+        'region': np.random.choice(['North','South','East','West'], n_samples),
+        'sales': np.random.normal(1000, 200, n_samples),
+        'profit': np.random.normal(150, 50, n_samples),
+    }
+    df = pd.DataFrame(data)
+    df.to_csv('sample_dataset.csv', index=False)
+
+if __name__ == '__main__':
+    df = generate_sample_data(1000)
+    print('Sample dataset created')
+'''
+
+
 class ProjectGeneratorPlugin(AutomationPlugin):
     """Plugin for generating programming projects with templates"""
 
@@ -90,20 +253,17 @@ class ProjectGeneratorPlugin(AutomationPlugin):
             os.makedirs(src_dir, exist_ok=True)
             os.makedirs(include_dir, exist_ok=True)
 
-            main_c = '''#include <stdio.h>\n\nint main() {\n    printf("Hello, C project!\\n");\n    return 0;\n}\n'''
             main_c_path = os.path.join(src_dir, 'main.c')
             with open(main_c_path, 'w', encoding='utf-8') as f:
-                f.write(main_c)
+                f.write(_C_PROJECT_MAIN)
 
-            makefile = 'CC=gcc\\nCFLAGS=-Wall -Wextra -std=c99\\nSRCDIR=src\\nSOURCES=$(wildcard $(SRCDIR)/*.c)\\nTARGET=program\\n\\n$(TARGET): $(SOURCES)\\n\\t$(CC) $(CFLAGS) -o $(TARGET) $(SOURCES)\\n\\nclean:\\n\\trm -f $(TARGET)\\n\\n.PHONY: clean\\n'
             makefile_path = os.path.join(project_path, 'Makefile')
             with open(makefile_path, 'w', encoding='utf-8') as f:
-                f.write(makefile)
+                f.write(_C_PROJECT_MAKEFILE)
 
-            readme = f"# {project_name}\\n\\nA simple C project.\\n"
             readme_path = os.path.join(project_path, 'README.md')
             with open(readme_path, 'w', encoding='utf-8') as f:
-                f.write(readme)
+                f.write(_C_PROJECT_README.substitute(project_name=project_name))
 
             return {'project_path': project_path, 'files_created': [main_c_path, makefile_path, readme_path], 'message': f'C project "{project_name}" created successfully'}
         except Exception as e:
@@ -115,12 +275,8 @@ class ProjectGeneratorPlugin(AutomationPlugin):
                 filename = filename + '.c'
             filename = self._sanitize_name(filename)
             file_path = os.path.join(location, filename) if location else os.path.join(os.path.expanduser('~'), 'Desktop', filename)
-            if program_type == 'addition':
-                content = """#include <stdio.h>\n\nint main() {\n    int a = 2;\n    int b = 3;\n    printf("Sum: %d\\n", a + b);\n    return 0;\n}\n"""
-            else:
-                content = """#include <stdio.h>\n\nint main() {\n    printf("Hello, World!\\n");\n    return 0;\n}\n"""
             with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+                f.write(_C_PROGRAM_ADDITION if program_type == 'addition' else _C_PROGRAM_HELLO)
             return {'file_path': file_path, 'message': f'C program "{filename}" created successfully'}
         except Exception as e:
             raise Exception(f'Failed to create C program: {e}')
@@ -142,9 +298,8 @@ class ProjectGeneratorPlugin(AutomationPlugin):
                 'scripts': {'dev': 'vite', 'build': 'vite build', 'preview': 'vite preview'}
             }
 
-            import json as _json
             with open(os.path.join(project_path, 'package.json'), 'w', encoding='utf-8') as f:
-                f.write(_json.dumps(package, indent=2))
+                f.write(json.dumps(package, indent=2))
 
             index_html = f"""<!doctype html>\n<html>\n  <head>\n    <meta charset=\"utf-8\" />\n    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\" />\n    <title>{project_name}</title>\n  </head>\n  <body>\n    <div id=\"root\"></div>\n    <script type=\"module\" src=\"/src/main.jsx\"></script>\n  </body>\n</html>\n"""
             with open(os.path.join(project_path, 'index.html'), 'w', encoding='utf-8') as f:
@@ -181,9 +336,8 @@ class ProjectGeneratorPlugin(AutomationPlugin):
             package = {'name': project_name.lower().replace(' ', '-'), 'version': '0.1.0', 'main': 'src/index.js', 'dependencies': {'express': '^4.18.0'}, 'scripts': {'start': 'node src/index.js'}}
             index_js = """const express = require('express')\nconst app = express()\nconst port = process.env.PORT || 3000\n\napp.get('/', (req, res) => {\n  res.send('Hello from Express backend')\n})\n\napp.listen(port, () => console.log(`Server listening on ${port}`))\n"""
 
-            import json as _json
             with open(os.path.join(project_path, 'package.json'), 'w', encoding='utf-8') as f:
-                f.write(_json.dumps(package, indent=2))
+                f.write(json.dumps(package, indent=2))
             with open(os.path.join(src_dir, 'index.js'), 'w', encoding='utf-8') as f:
                 f.write(index_js)
 
@@ -208,65 +362,16 @@ class ProjectGeneratorPlugin(AutomationPlugin):
             project_path = os.path.join(location, project_name)
             os.makedirs(project_path, exist_ok=True)
 
-            scraper_content = (
-                "#!/usr/bin/env python3\n"
-                "import requests\n"
-                "from bs4 import BeautifulSoup\n"
-                "import json\n"
-                "from datetime import datetime\n\n"
-                "def scrape_headlines():\n"
-                "    headlines = []\n"
-                "    sources = {'BBC':'https://www.bbc.com/news','Reuters':'https://www.reuters.com'}\n"
-                "    for source_name, url in sources.items():\n"
-                "        try:\n"
-                "            r = requests.get(url, timeout=10)\n"
-                "            soup = BeautifulSoup(r.content, 'html.parser')\n"
-                "            elems = soup.select('h1,h2,h3')[:5]\n"
-                "            for e in elems:\n"
-                "                t = e.get_text(strip=True)\n"
-                "                if len(t) > 20:\n"
-                "                    headlines.append({'source': source_name, 'headline': t, 'timestamp': datetime.now().isoformat(), 'url': url})\n"
-                "        except Exception:\n"
-                "            pass\n"
-                "    return headlines\n\n"
-                "if __name__ == '__main__':\n"
-                "    hs = scrape_headlines()\n"
-                "    with open('headlines.json', 'w', encoding='utf-8') as f:\n"
-                "        json.dump(hs, f, indent=2, ensure_ascii=False)\n"
-            )
 
             main_path = os.path.join(project_path, 'main.py')
             with open(main_path, 'w', encoding='utf-8') as f:
-                f.write(scraper_content)
+                f.write(_SCRAPER_MAIN_PY)
 
-            requirements_content = 'requests>=2.31.0\nbeautifulsoup4>=4.12.0\nlxml>=4.9.0\n'
             with open(os.path.join(project_path, 'requirements.txt'), 'w', encoding='utf-8') as f:
-                f.write(requirements_content)
+                f.write(_SCRAPER_REQUIREMENTS)
 
-            readme_content = f"""# {project_name}
-
-A Python web scraping project for collecting news headlines.
-
-## Installation
-
-```bash
-pip install -r requirements.txt
-```
-
-## Usage
-
-```bash
-python main.py
-```
-
-## Files
-
-- main.py - Main scraper script
-- requirements.txt - Python dependencies
-- headlines.json - Output file (created after running)
-"""
             with open(os.path.join(project_path, 'README.md'), 'w', encoding='utf-8') as f:
-                f.write(readme_content)
+                f.write(_SCRAPER_README.substitute(project_name=project_name))
 
             return {'project_path': project_path, 'files_created': [main_path, os.path.join(project_path, 'requirements.txt'), os.path.join(project_path, 'README.md')], 'message': f'Created web scraping project: {project_name}'}
         except Exception as e:
@@ -285,95 +390,13 @@ python main.py
             os.makedirs(os.path.join(project_path, 'reports'), exist_ok=True)
             os.makedirs(os.path.join(project_path, 'visualizations'), exist_ok=True)
 
-            # Create a simple notebook JSON
-            import json as _json
-            notebook_data = {
-                "cells": [
-                    {"cell_type": "markdown", "metadata": {}, "source": ["# Data Analysis Project\n", "\n", "Comprehensive data analysis with automated report generation"]},
-                    {"cell_type": "code", "execution_count": None, "metadata": {}, "outputs": [], "source": ["# Import required libraries\n", "import pandas as pd\n", "import numpy as np\n", "import matplotlib.pyplot as plt\n", "import seaborn as sns\n", "from datetime import datetime\n", "\n", "print('📊 Data Analysis Environment Ready!')"]}
-                ],
-                "metadata": {"kernelspec": {"display_name": "Python 3", "language": "python", "name": "python3"}, "language_info": {"name": "python", "version": "3.8.0"}},
-                "nbformat": 4,
-                "nbformat_minor": 4
-            }
-
-            notebook_content = _json.dumps(notebook_data, indent=1)
-            with open(os.path.join(project_path, 'notebooks', 'analysis_notebook.ipynb'), 'w', encoding='utf-8') as f:
-                f.write(notebook_content)
-
-            utils_content = '''#!/usr/bin/env python3
-"""
-Data Analysis Utilities
-"""
-
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from datetime import datetime
-import os
-
-class DataAnalyzer:
-    def __init__(self, data_path=None):
-        self.data_path = data_path
-        self.df = None
-    
-    def load_data(self, file_path):
-        ext = os.path.splitext(file_path)[1].lower()
-        if ext == '.csv':
-            self.df = pd.read_csv(file_path)
-        elif ext in ['.xlsx', '.xls']:
-            self.df = pd.read_excel(file_path)
-        elif ext == '.json':
-            self.df = pd.read_json(file_path)
-        else:
-            raise ValueError(f"Unsupported file format: {ext}")
-        return self.df
-'''
-            with open(os.path.join(project_path, 'src', 'data_analyzer.py'), 'w', encoding='utf-8') as f:
-                f.write(utils_content)
-
-            requirements_content = 'jupyter>=1.0.0\npandas>=2.0.0\nnumpy>=1.24.0\nmatplotlib>=3.7.0\nseaborn>=0.12.0\nscipy>=1.10.0\nopenpyxl>=3.1.0\n'
-            with open(os.path.join(project_path, 'requirements.txt'), 'w', encoding='utf-8') as f:
-                f.write(requirements_content)
-
-            readme_content = f"""# {project_name}
-
-Comprehensive data analysis project with automated report generation.
-
-See notebooks/analysis_notebook.ipynb for examples.
-"""
-            with open(os.path.join(project_path, 'README.md'), 'w', encoding='utf-8') as f:
-                f.write(readme_content)
-
-            sample_script = '''#!/usr/bin/env python3
-"""
-Generate sample data for analysis
-"""
-import pandas as pd
-import numpy as np
-from datetime import datetime, timedelta
-
-def generate_sample_data(n_samples=1000):
-    np.random.seed(42)
-    start_date = datetime.now() - timedelta(days=n_samples)
-    dates = pd.date_range(start_date, periods=n_samples, freq='D')
-    data = {
-        'date': dates,
-        'product': np.random.choice(['Product_A','Product_B','Product_C','Product_D'], n_samples),
-        'region': np.random.choice(['North','South','East','West'], n_samples),
-        'sales': np.random.normal(1000, 200, n_samples),
-        'profit': np.random.normal(150, 50, n_samples),
-    }
-    df = pd.DataFrame(data)
-    df.to_csv('sample_dataset.csv', index=False)
-
-if __name__ == '__main__':
-    df = generate_sample_data(1000)
-    print('Sample dataset created')
-'''
-            with open(os.path.join(project_path, 'data', 'generate_sample_data.py'), 'w', encoding='utf-8') as f:
-                f.write(sample_script)
+            _write_files({
+                os.path.join(project_path, 'notebooks', 'analysis_notebook.ipynb'): _ANALYSIS_NOTEBOOK_JSON,
+                os.path.join(project_path, 'src', 'data_analyzer.py'): _DATA_ANALYZER_PY,
+                os.path.join(project_path, 'requirements.txt'): _ANALYSIS_REQUIREMENTS,
+                os.path.join(project_path, 'README.md'): _ANALYSIS_README.substitute(project_name=project_name),
+                os.path.join(project_path, 'data', 'generate_sample_data.py'): _SAMPLE_DATA_PY,
+            })
 
             return {'project_path': project_path, 'files_created': [os.path.join(project_path, 'notebooks', 'analysis_notebook.ipynb'), os.path.join(project_path, 'src', 'data_analyzer.py'), os.path.join(project_path, 'requirements.txt')], 'message': f'Created comprehensive data analysis project: {project_name}'}
         except Exception as e:
@@ -0,0 +1,286 @@
+"""
+Tests for EnhancedWindowsAdapter and its elevated helper
+
+The Windows-only modules (winreg, pywin32) are replaced with mocks, so these
+run on any OS; nothing here calls into the Windows API.
+"""
+
+import importlib
+import json
+import sys
+import threading
+import unittest
+from datetime import date
+from unittest import mock
+
+_WINDOWS_MODULES = (
+    'winreg', 'winerror', 'pywintypes', 'pythoncom',
+    'win32api', 'win32con', 'win32gui', 'win32process', 'win32event',
+    'win32file', 'win32pipe', 'win32security', 'win32service', 'win32serviceutil',
+    'win32com', 'win32com.client',
+)
+_ERROR_ACCESS_DENIED = 5
+_ERROR_MORE_DATA = 234
+
+
+class _WinError(Exception):
+    """Stand-in for pywintypes.error"""
+
+    def __init__(self, winerror, funcname='', strerror=''):
+        super().__init__(winerror, funcname, strerror)
+        self.winerror = winerror
+
+
+def _import_enhanced_adapter():
+    """Import enhanced_windows_adapter and admin_helper with mocked Windows modules"""
+    modules = {name: mock.MagicMock() for name in _WINDOWS_MODULES}
+    modules['pywintypes'].error = _WinError
+    modules['winerror'].ERROR_MORE_DATA = _ERROR_MORE_DATA
+    with mock.patch.dict(sys.modules, modules):
+        for name in ('omni_automator.os_adapters.admin_helper',
+                     'omni_automator.os_adapters.enhanced_windows_adapter'):
+            sys.modules.pop(name, None)
+        return (importlib.import_module('omni_automator.os_adapters.enhanced_windows_adapter'),
+                importlib.import_module('omni_automator.os_adapters.admin_helper'))
+
+
+ewa, admin_helper = _import_enhanced_adapter()
+
+
+def _bare_adapter():
+    """An EnhancedWindowsAdapter with only the admin-helper state initialized"""
+    adapter = ewa.EnhancedWindowsAdapter.__new__(ewa.EnhancedWindowsAdapter)
+    adapter.logger = mock.Mock()
+    adapter._admin_helper_lock = threading.Lock()
+    adapter._admin_pipe = None
+    adapter._admin_process = None
+    adapter._admin_helper_unavailable = False
+    return adapter
+
+
+class FirewallRuleCommandsTest(unittest.TestCase):
+    """Grouping of manage_firewall_bulk rules into netsh commands"""
+
+    def test_ports_merge_for_identical_rules(self):
+        commands = ewa._firewall_rule_commands([
+            {'rule_name': 'web', 'port': 80},
+            {'rule_name': 'web', 'port': 443},
+        ])
+        self.assertEqual(commands, [[
+            'netsh', 'advfirewall', 'firewall', 'add', 'rule',
+            'name=web', 'dir=in', 'action=allow', 'protocol=TCP', 'localport=80,443',
+        ]])
+
+    def test_different_remote_ips_are_not_merged(self):
+        commands = ewa._firewall_rule_commands([
+            {'rule_name': 'db', 'port': 5432, 'remote_ip': '10.0.0.1'},
+            {'rule_name': 'db', 'port': 6379, 'remote_ip': '10.0.0.2'},
+        ])
+        self.assertEqual(len(commands), 2)
+        self.assertIn('localport=5432', commands[0])
+        self.assertIn('remoteip=10.0.0.1', commands[0])
+        self.assertIn('localport=6379', commands[1])
+        self.assertIn('remoteip=10.0.0.2', commands[1])
+
+    def test_rule_without_remote_ip_stays_unrestricted(self):
+        commands = ewa._firewall_rule_commands([
+            {'rule_name': 'ssh', 'port': 22},
+            {'rule_name': 'ssh', 'port': 2222, 'remote_ip': '192.168.1.5'},
+        ])
+        self.assertEqual(len(commands), 2)
+        self.assertFalse(any(arg.startswith('remoteip=') for arg in commands[0]))
+        self.assertIn('localport=22', commands[0])
+
+    def test_program_rule_ignores_protocol_and_port(self):
+        commands = ewa._firewall_rule_commands([
+            {'rule_name': 'app', 'program': r'C:\Apps\a&b.exe', 'port': 80},
+        ])
+        self.assertEqual(commands, [[
+            'netsh', 'advfirewall', 'firewall', 'add', 'rule',
+            'name=app', 'dir=in', 'action=allow', r'program=C:\Apps\a&b.exe',
+        ]])
+
+    def test_rule_without_program_or_port_is_rejected(self):
+        with self.assertRaises(ValueError):
+            ewa._firewall_rule_commands([{'rule_name': 'empty'}])
+
+    def test_no_rules_is_rejected(self):
+        with self.assertRaises(ValueError):
+            ewa._firewall_rule_commands([])
+
+
+class TaskTriggerFieldsTest(unittest.TestCase):
+    """Trigger properties set by _register_scheduled_task"""
+
+    SUNDAY = date(2026, 10, 18)
+
+    def test_hour_is_zero_padded(self):
+        fields = ewa._task_trigger_fields('ONCE', '9:05', self.SUNDAY)
+        self.assertEqual(fields, {'StartBoundary': '2026-10-18T09:05:00'})
+
+    def test_daily(self):
+        fields = ewa._task_trigger_fields('DAILY', '09:00', self.SUNDAY)
+        self.assertEqual(fields['DaysInterval'], 1)
+
+    def test_weekly_defaults_to_todays_weekday(self):
+        self.assertEqual(ewa._task_trigger_fields('WEEKLY', '09:00', self.SUNDAY)['DaysOfWeek'], 0x01)
+        saturday = date(2026, 10, 24)
+        fields = ewa._task_trigger_fields('WEEKLY', '09:00', saturday)
+        self.assertEqual(fields['DaysOfWeek'], 0x40)
+        self.assertEqual(fields['WeeksInterval'], 1)
+
+    def test_monthly_defaults_to_first_day_of_every_month(self):
+        fields = ewa._task_trigger_fields('MONTHLY', '23:30', self.SUNDAY)
+        self.assertEqual(fields['DaysOfMonth'], 1)
+        self.assertEqual(fields['MonthsOfYear'], 0xFFF)
+        self.assertEqual(fields['StartBoundary'], '2026-10-18T23:30:00')
+
+
+class SchtasksCsvTest(unittest.TestCase):
+    """Parsing of `schtasks /query /fo csv /nh` output"""
+
+    def test_rows_become_task_dicts(self):
+        output = (
+            '"\\Backup","10/19/2026 9:00:00 AM","Ready"\r\n'
+            '\r\n'
+            '"\\Name, with comma","N/A","Disabled"\r\n'
+        )
+        tasks = list(ewa.EnhancedWindowsAdapter._iter_schtasks_csv(output))
+        self.assertEqual(tasks, [
+            {'name': '\\Backup', 'next_run': '10/19/2026 9:00:00 AM', 'state': 'Ready'},
+            {'name': '\\Name, with comma', 'next_run': 'N/A', 'state': 'Disabled'},
+        ])
+
+
+class RunSequenceTest(unittest.TestCase):
+    """Batched elevated commands stop at the first failure"""
+
+    def test_stops_at_first_failure(self):
+        ran = []
+
+        def run(command):
+            ran.append(command)
+            ok = command[0] != 'bad'
+            return {'success': ok, 'output': command[0], 'error': '' if ok else 'failed', 'return_code': 0 if ok else 1}
+
+        result = ewa.run_sequence(run, [['a'], ['bad'], ['c']])
+        self.assertEqual(ran, [['a'], ['bad']])
+        self.assertFalse(result['success'])
+        self.assertEqual(result['return_code'], 1)
+        self.assertEqual(result['output'], 'abad')
+
+
+class AdminHelperStartupTest(unittest.TestCase):
+    """Connecting to the elevated helper's pipe"""
+
+    HELPER_PROCESS = 'helper-process'
+    PIPE = 'pipe-handle'
+
+    def setUp(self):
+        self.adapter = _bare_adapter()
+        self.kernel32 = mock.Mock()
+        self.kernel32.WaitForSingleObject.return_value = ewa._WAIT_TIMEOUT  # Helper still running
+        self.kernel32.GetProcessId.return_value = 42
+        self.win32pipe = mock.Mock()
+        self.win32pipe.GetNamedPipeServerProcessId.return_value = 42
+        self.win32file = mock.MagicMock()
+        self.time = mock.Mock()
+        self.time.monotonic.return_value = 0.0
+        windll = mock.Mock(kernel32=self.kernel32)
+        for patcher in (
+            mock.patch.object(ewa.ctypes, 'windll', windll, create=True),
+            mock.patch.object(ewa, 'win32pipe', self.win32pipe),
+            mock.patch.object(ewa, 'win32file', self.win32file),
+            mock.patch.object(ewa, 'time', self.time),
+            mock.patch.object(ewa.EnhancedWindowsAdapter, '_current_user_sid', return_value='S-1-5-21-7'),
+            mock.patch.object(ewa.EnhancedWindowsAdapter, '_shell_execute_elevated',
+                              return_value=self.HELPER_PROCESS),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_passes_pid_and_user_sid_to_helper(self):
+        self.win32file.CreateFile.return_value = self.PIPE
+        self.adapter._start_admin_helper()
+        parameters = ewa.EnhancedWindowsAdapter._shell_execute_elevated.call_args[0][1]
+        self.assertTrue(parameters.endswith(f' {ewa.os.getpid()} S-1-5-21-7'))
+
+    def test_retries_until_pipe_exists(self):
+        self.win32file.CreateFile.side_effect = [
+            _WinError(ewa._ERROR_FILE_NOT_FOUND), _WinError(ewa._ERROR_PIPE_BUSY), self.PIPE,
+        ]
+        self.adapter._start_admin_helper()
+        self.assertEqual(self.win32file.CreateFile.call_count, 3)
+        self.assertEqual(self.adapter._admin_pipe, self.PIPE)
+        self.assertEqual(self.adapter._admin_process, self.HELPER_PROCESS)
+        self.kernel32.TerminateProcess.assert_not_called()
+
+    def test_access_denied_fails_immediately(self):
+        self.win32file.CreateFile.side_effect = _WinError(_ERROR_ACCESS_DENIED)
+        with self.assertRaises(_WinError):
+            self.adapter._start_admin_helper()
+        self.assertEqual(self.win32file.CreateFile.call_count, 1)
+        self.time.sleep.assert_not_called()
+        self.kernel32.TerminateProcess.assert_called_once_with(self.HELPER_PROCESS, 1)
+
+    def test_gives_up_after_timeout(self):
+        self.win32file.CreateFile.side_effect = _WinError(ewa._ERROR_FILE_NOT_FOUND)
+        self.time.monotonic.side_effect = [0.0, 1.0, ewa._COMMAND_TIMEOUT + 1.0]
+        with self.assertRaises(TimeoutError):
+            self.adapter._start_admin_helper()
+        self.assertEqual(self.win32file.CreateFile.call_count, 2)
+        self.kernel32.TerminateProcess.assert_called_once_with(self.HELPER_PROCESS, 1)
+
+    def test_gives_up_when_helper_exits(self):
+        self.win32file.CreateFile.side_effect = _WinError(ewa._ERROR_FILE_NOT_FOUND)
+        self.kernel32.WaitForSingleObject.return_value = 0  # Process signalled: it exited
+        with self.assertRaises(TimeoutError):
+            self.adapter._start_admin_helper()
+        self.assertEqual(self.win32file.CreateFile.call_count, 1)
+
+    def test_rejects_pipe_served_by_another_process(self):
+        self.win32file.CreateFile.return_value = self.PIPE
+        self.win32pipe.GetNamedPipeServerProcessId.return_value = 99
+        with self.assertRaises(PermissionError):
+            self.adapter._start_admin_helper()
+        self.win32file.CloseHandle.assert_called_once_with(self.PIPE)
+        self.assertIsNone(self.adapter._admin_pipe)
+
+    def test_startup_failure_disables_helper(self):
+        with mock.patch.object(self.adapter, '_start_admin_helper',
+                               side_effect=_WinError(_ERROR_ACCESS_DENIED)) as start:
+            self.assertIsNone(self.adapter._run_via_admin_helper({'command': ['whoami']}))
+            self.assertIsNone(self.adapter._run_via_admin_helper({'command': ['whoami']}))
+        start.assert_called_once()
+        self.assertTrue(self.adapter._admin_helper_unavailable)
+
+
+class AdminHelperProtocolTest(unittest.TestCase):
+    """Message framing and pipe security of the elevated helper"""
+
+    def test_write_message_sends_one_json_message(self):
+        with mock.patch.object(admin_helper, 'win32file') as win32file:
+            admin_helper.write_message('pipe', {'commands': [['netsh', 'a&b']]})
+        handle, payload = win32file.WriteFile.call_args[0]
+        self.assertEqual(handle, 'pipe')
+        self.assertEqual(json.loads(payload.decode('utf-8')), {'commands': [['netsh', 'a&b']]})
+
+    def test_read_message_joins_partial_reads(self):
+        with mock.patch.object(admin_helper, 'win32file') as win32file:
+            win32file.ReadFile.side_effect = [(_ERROR_MORE_DATA, b'{"success": '), (0, b'true}')]
+            self.assertEqual(json.loads(admin_helper.read_message('pipe')), {'success': True})
+        self.assertEqual(win32file.ReadFile.call_count, 2)
+
+    def test_pipe_grants_only_the_launching_user(self):
+        self.assertEqual(admin_helper._pipe_sddl('S-1-5-21-7'), 'D:(A;;GRGW;;;S-1-5-21-7)S:(ML;;NW;;;ME)')
+
+    def test_command_list_runs_without_shell(self):
+        completed = mock.Mock(returncode=0, stdout='ok', stderr='')
+        with mock.patch.object(admin_helper.subprocess, 'run', return_value=completed) as run:
+            result = admin_helper.run_command(['netsh', 'name=a&b'])
+        self.assertFalse(run.call_args[1]['shell'])
+        self.assertTrue(result['success'])
+
+
+if __name__ == '__main__':
+    unittest.main()